@@ -24,19 +24,80 @@
 from tkinter import *
 from tkinter import filedialog
 import customtkinter as ctk
-import PIL.Image, PIL.ImageTk
 import logging, os, queue
-from utils.downloader import download_from_github, download_dependencies, check_for_updates, download_update, sync_metadata
+from functools import lru_cache
 from utils.config import load_config, save_config
-from utils.injector import ReshadeSetup
 from utils.path import resource_path
 from utils.theme import ThemeManager
-from gui import SettingsDialog, PresetsDialog, LauncherDialog, DownloadDialog
+from utils.startup import StartupTasks
+from utils.trace import span, mark
+from utils.images import load_image
 from gui.widgets import StyledToolTip, StyledPopup
 
+#* The downloader (requests), the injector (pymem, psutil) and the dialogs are imported where they are
+#* first used, see tools/import_report.py for the cold-start import cost
+
 logger = logging.getLogger(__name__)
 
+NEXT_PAGE = {
+    "SetupPage": "ConfigPage",
+    "ConfigPage": "ReshadePage",
+    "ReshadePage": "HomePage",
+    "HomePage": "ReshadePage",
+}
+
 # Animations
+FADE_STEPS = 10
+FADE_INTERVAL = 60
+
+@lru_cache(maxsize=64)
+def fade_frames(start: tuple, end: tuple) -> tuple[str, ...]:
+    """Hex colors from start to end (winfo_rgb tuples), computed once per color pair."""
+    return tuple(
+        "#{:02x}{:02x}{:02x}".format(*[int((a + (b - a) * step / FADE_STEPS) * 255 / 65535) for a, b in zip(start, end)])
+        for step in range(FADE_STEPS + 1)
+    )
+
+
+class FadeDriver:
+    """Single after() clock shared by every FadeInLabel.
+
+    All running fades advance together on one tick; labels whose page is not the one on screen
+    are snapped to their final colors, and the clock stops once nothing is left to animate.
+    """
+    def __init__(self):
+        self.labels = {}
+        self.clock = None
+
+    def add(self, label):
+        self.labels[label] = 0
+        if self.clock is None:
+            self.clock = label.after(FADE_INTERVAL, self.tick, label.winfo_toplevel())
+
+    def tick(self, root):
+        self.clock = None
+        current_page = getattr(root, "current_page", None)
+
+        for label, step in list(self.labels.items()):
+            if not label.winfo_exists():
+                del self.labels[label]
+                continue
+
+            hidden = current_page is not None and not str(label).startswith(f"{current_page}.")
+            step = FADE_STEPS if hidden else step + 1
+            label.show_frame(step)
+
+            if step >= FADE_STEPS:
+                del self.labels[label]
+            else:
+                self.labels[label] = step
+
+        if self.labels:
+            self.clock = root.after(FADE_INTERVAL, self.tick, root)
+
+
+fade_driver = FadeDriver()
+
 class FadeInLabel(ctk.CTkLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -52,29 +113,23 @@ class FadeInLabel(ctk.CTkLabel):
                 self.colors[key] = (rgb_color, rgb_color)
             else:
                 self.colors[key] = self.winfo_rgb(color[0]), self.winfo_rgb(color[1])
-        
-        self.transition = 0
-        self.change_color()
-        
-    def get_curr(self, start, end):
-        rgb_to_hex = lambda rgb : '#{:02x}{:02x}{:02x}'.format(*[int(val * 255 / 65535) for val in rgb])
-        return rgb_to_hex([start[i] + (end[i]-start[i])*self.transition for i in range(3)])
-        
-    def change_color(self):
-        self.configure(
-            **{key:(self.get_curr(self.colors['base'][0], self.colors[key][0]),
-                    self.get_curr(self.colors['base'][1], self.colors[key][1])) for key in self.fields}
-        )
-        self.transition += 0.1
-        if self.transition < 1:
-            self.after(60, self.change_color)
+
+        # Light and dark frames per field
+        self.frames = {
+            key: (fade_frames(self.colors['base'][0], self.colors[key][0]), fade_frames(self.colors['base'][1], self.colors[key][1]))
+            for key in self.fields
+        }
+        fade_driver.add(self)
+
+    def show_frame(self, step: int):
+        self.configure(**{key: (light[step], dark[step]) for key, (light, dark) in self.frames.items()})
 
 
 class Image_Frame(ctk.CTkFrame):
     def __init__(self, master, theme_name: str):
         super().__init__(master, width=256, height=256)
         self.current_theme = theme_name
-        self.default_image = ctk.CTkImage(PIL.Image.open(resource_path("themes/Default/MainFrame/logo-app.png")), size=ThemeManager.get_image_size("Default"))
+        self.default_image = load_image(resource_path("themes/Default/MainFrame/logo-app.png"), ThemeManager.get_image_size("Default"))
 
         self.image_label = ctk.CTkLabel(master=self, text="", image=self.default_image)
         self.image_label.place(relx=0.5, rely=0.5, anchor=CENTER)
@@ -83,7 +138,7 @@ class Image_Frame(ctk.CTkFrame):
         if path and os.path.exists(path):
             try:
                 image_size = size or ThemeManager.get_image_size(self.current_theme)
-                return ctk.CTkImage(PIL.Image.open(path), size=image_size)
+                return load_image(path, image_size)
             except Exception as e:
                 logger.error(f"Failed to load custom image: {e}")
         return None
@@ -122,12 +177,10 @@ class Starluxe(ctk.CTk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
-        # Controller the pages
+        # Controller the pages, each one is built on first navigation
         self.pages = {}
-        for PageClass in (HomePage, ReshadePage, ConfigPage, SetupPage):
-            page = PageClass(self.container, self)
-            self.pages[PageClass.__name__] = page
-            page.grid(row=0, column=0, sticky="nsew")
+        self.current_page = None
+        self.page_classes = {PageClass.__name__: PageClass for PageClass in (HomePage, ReshadePage, ConfigPage, SetupPage)}
 
         initial_page = any(
             game_folder.get("folder", "").strip()
@@ -138,11 +191,30 @@ class Starluxe(ctk.CTk):
         else:
             self.show_page("SetupPage")
 
+    def get_page(self, page_name: str):
+        page = self.pages.get(page_name)
+        if page is None:
+            with span("page.build", "ui", page=page_name):
+                page = self.page_classes[page_name](self.container, self)
+            page.grid(row=0, column=0, sticky="nsew")
+            self.pages[page_name] = page
+            logger.debug(f"Page built: {page_name}")
+        return page
+
+    def prebuild_page(self, page_name: str):
+        if page_name and page_name not in self.pages:
+            page = self.get_page(page_name)
+            page.lower()
+
     # Manager the pages
     def show_page(self, page_name: str):
-        page = self.pages[page_name]
+        page = self.get_page(page_name)
         page.tkraise()
+        self.current_page = page
         logger.info(f"Page initialized: {page_name}")
+
+        # Build the next likely page once the current one has painted and the event loop is idle
+        self.after(200, lambda: self.after_idle(self.prebuild_page, NEXT_PAGE.get(page_name)))
     
     def iconbitmap(self, bitmap):
         self._iconbitmap_method_called = False
@@ -186,7 +258,7 @@ class HomePage(BasePage):
         super().__init__(parent, controller)
         self.modal = None
         self.previous_page = "ReshadePage"
-        self.button_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/button-left.png")), size=(32, 32))
+        self.button_icon = load_image(resource_path("assets/icon/button-left.png"), (32, 32))
         self.frame.load_theme_image("MainFrame/logo-home")
         self.frame.grid(pady=40)
 
@@ -206,6 +278,8 @@ class HomePage(BasePage):
         self.button_2.grid_configure(pady=(40, 10))
 
     def open_modal_start(self):
+        from gui import LauncherDialog
+
         last_game = self.settings["Launcher"].get("last_played_game", "")
         game_data = self.settings["Games"].get(last_game, {})
         folder = game_data.get("folder", "").strip()
@@ -224,6 +298,8 @@ class HomePage(BasePage):
             self.modal.focus()
 
     def open_modal(self):
+        from gui import SettingsDialog
+
         if self.modal is None or not self.modal.winfo_exists():
             self.modal = SettingsDialog(self, self.settings, controller=self.controller)
         else:
@@ -257,13 +333,16 @@ class ReshadePage(BasePage):
         self.button_2.grid_configure(pady=(10, 20))
 
     def download_preset(self):
+        from gui import DownloadDialog
+        from utils.downloader import download_from_github
+
         selected_presets = self.settings["Packages"].get("selected", [])
         if not selected_presets or not any(preset.strip() for preset in selected_presets):
             StyledPopup(title="Warning", message="Select a preset before downloading!")
             logging.warning("You haven't selected a preset!")
             return
 
-        def download_task(progress_callback):
+        def download_task(progress_callback, job):
             download_from_github(
                 settings["Account"]["github_name"], 
                 settings["Account"]["repository_name"],
@@ -271,7 +350,9 @@ class ReshadePage(BasePage):
                 settings["Packages"]["selected"],
                 settings["Packages"].get("download_dir", ""),
                 self.download_queue,
-                progress_callback
+                progress_callback,
+                settings["Packages"].get("concurrency", 4),
+                job
             )
             response = self.download_queue.get()
             if isinstance(response, dict):
@@ -284,6 +365,8 @@ class ReshadePage(BasePage):
             StyledPopup(message=response["message"])
 
     def open_modal(self):
+        from gui import PresetsDialog
+
         if self.modal is None or not self.modal.winfo_exists():
             self.modal = PresetsDialog(self, self.settings)
         else:
@@ -320,6 +403,8 @@ class ConfigPage(BasePage):
 
     # Check and saves the path in settings.json
     def save_path(self):
+        from utils.injector import ReshadeSetup
+
         game_path = self.path_entry.get().strip()
 
         if not game_path:
@@ -357,7 +442,7 @@ class SetupPage(BasePage):
         self.text_2.configure(text="Enhance your game visuals with the \nReShade")
         self.text_2.grid_configure(pady=(20, 30))
 
-        self.button_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/button-next.png")), size=(32, 32))
+        self.button_icon = load_image(resource_path("assets/icon/button-next.png"), (32, 32))
         self.button_1.configure(image=self.button_icon, width=0, height=0, fg_color="transparent", command=lambda: self.controller.show_page("ConfigPage"))
         self.button_1.grid_configure(pady=(40, 10))
         StyledToolTip(self.button_1, message="🎉 Thanks for testing! Enjoy your experience!")
@@ -380,31 +465,58 @@ if __name__ == "__main__":
     for lib in ("PIL", "urllib3"):
         logging.getLogger(lib).setLevel(logging.WARNING)
 
-    settings = load_config()
+    with span("config.load"):
+        settings = load_config()
 
     #* Load settings before starting the application
-    themes = ThemeManager(resource_path("themes"))
-    ctk.set_default_color_theme(themes.load_theme(settings["Launcher"]["gui_theme"]))
+    with span("theme.load"):
+        themes = ThemeManager(resource_path("themes"))
+        ctk.set_default_color_theme(themes.load_theme(settings["Launcher"]["gui_theme"]))
+
+    with span("app.build", "ui"):
+        app = Starluxe(settings)
 
-    app = Starluxe(settings)
-    setup_system = ReshadeSetup(settings, "", settings["Launcher"]["xxmi_feature_enabled"])
-    result_system = setup_system.verify_system()
-    result_update = check_for_updates("Dimitri-Matheus", settings["Launcher"]["auto_check_update"])
-    sync_metadata(settings["Account"]["github_name"], settings["Account"]["repository_name"])
+    with span("system.verify"):
+        from utils.injector import ReshadeSetup
+        setup_system = ReshadeSetup(settings, "", settings["Launcher"]["xxmi_feature_enabled"])
+        result_system = setup_system.verify_system()
+
+    def startup_result(name, result):
+        if name != "update" or not result or not result["status"]:
+            return
 
-    if result_update["status"]:
         msbox_update = StyledPopup(title="New Version!", message=(
             "Good news! An update is ready. \n\n   "
-            f"Version {result_update['version']} ({result_update['size'] / 1_000_000:.2f} MB)"
+            f"Version {result['version']} ({result['size'] / 1_000_000:.2f} MB)"
         ), topmost=True, option_1="Update now", option_2="Later",)
         
         if msbox_update.get() == "Update now":
-            download_update(result_update["url"])
+            from utils.downloader import download_update
+            download_update(result["url"])
+
+    # The downloader is imported on the worker threads, off the UI path
+    def update_task():
+        from utils.downloader import check_for_updates
+        return check_for_updates("Dimitri-Matheus", settings["Launcher"]["auto_check_update"], settings["Launcher"]["cache_ttl"])
+
+    def metadata_task():
+        from utils.downloader import sync_metadata
+        return sync_metadata(settings["Account"]["github_name"], settings["Account"]["repository_name"], settings["Launcher"]["cache_ttl"])
+
+    #* Network checks run in the background so the window paints right away
+    startup = StartupTasks(deadline=15.0)
+    startup.submit("update", update_task)
+    startup.submit("metadata", metadata_task)
+    startup.start(app, startup_result)
 
     #! Hard‑Coded
     if not result_system["status"] and result_system["message"].strip().lower().count("shaders folder not found!") == 1:
-        def download_task(progress_callback):
-            return download_dependencies(settings["Packages"]["download_dir"], progress_callback)
+        from gui import DownloadDialog
+        from utils.downloader import download_dependencies
+
+        def download_task(progress_callback, job):
+            return download_dependencies(settings["Packages"]["download_dir"], progress_callback, job)
         DownloadDialog(app, "Downloading Dependencies", True, download_task)
     
+    app.after_idle(lambda: mark("mainloop.first_idle", "ui"))
     app.mainloop()
\ No newline at end of file
@@ -1,5 +1,17 @@
 # gui/__init__.py
-from .settings_window import SettingsDialog
-from .presets_window import PresetsDialog
-from .launcher_window import LauncherDialog
-from .update_window import DownloadDialog
\ No newline at end of file
+# Dialogs are imported on first access so the main window does not pay for them at startup
+
+def __getattr__(name):
+    if name == "SettingsDialog":
+        from .settings_window import SettingsDialog
+        return SettingsDialog
+    if name == "PresetsDialog":
+        from .presets_window import PresetsDialog
+        return PresetsDialog
+    if name == "LauncherDialog":
+        from .launcher_window import LauncherDialog
+        return LauncherDialog
+    if name == "DownloadDialog":
+        from .update_window import DownloadDialog
+        return DownloadDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,14 @@
 from tkinter import *
 from tkinter import filedialog
 import customtkinter as ctk
-import PIL.Image, PIL.ImageTk
 from pathlib import Path
 import logging, re, math, shutil
 from CTkMenuBar import CustomDropdownMenu
 from utils.config import save_config
 from utils.path import resource_path
 from utils.injector import ReshadeSetup
+from utils.images import load_image
+from utils.launch import LaunchPipeline
 from .widgets import StyledToolTip, StyledPopup
 
 logger = logging.getLogger(__name__)
@@ -20,15 +21,16 @@ class LauncherDialog(ctk.CTkToplevel):
         self.transient(master)
         self.settings = settings_load
         self.modal = None
+        self.pipeline = None
 
         self.title("Start Your Game")
         self.geometry("700x340")
         self.resizable(width=False, height=False)
         self.grab_set()
 
-        self.prev_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/button-left.png")), size=(32, 32))
-        self.next_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/button-right.png")), size=(32, 32))
-        self.add_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/button-add.png")), size=(32, 32))
+        self.prev_icon = load_image(resource_path("assets/icon/button-left.png"), (32, 32))
+        self.next_icon = load_image(resource_path("assets/icon/button-right.png"), (32, 32))
+        self.add_icon = load_image(resource_path("assets/icon/button-add.png"), (32, 32))
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=0)
@@ -58,6 +60,17 @@ class LauncherDialog(ctk.CTkToplevel):
         self.next_button.configure(width=0, height=0, fg_color="transparent")
         self.next_button.grid(row=0, column=2, padx=10)
 
+        # Launch status, shown in place of the navigation while a game is starting
+        self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.status_frame.grid_columnconfigure(0, weight=1)
+
+        self.status_label = ctk.CTkLabel(self.status_frame, text="", font=ctk.CTkFont(family="Verdana", size=14))
+        self.status_label.grid(row=0, column=0, padx=10)
+
+        self.cancel_button = ctk.CTkButton(self.status_frame, text="Cancel", font=ctk.CTkFont(family="Verdana", size=12, weight="bold"), command=self.cancel_launch)
+        self.cancel_button.configure(width=110, height=34, corner_radius=8, fg_color="#E73B3C")
+        self.cancel_button.grid(row=0, column=1, padx=10)
+
         self.controller_pages()
         self.show_page(0)
 
@@ -117,16 +130,48 @@ class LauncherDialog(ctk.CTkToplevel):
             StyledPopup(message="Please set the game folder first in Settings")
             return
 
+        if self.pipeline is not None:
+            return
+
         self.settings["Launcher"]["last_played_game"] = game_code
         save_config(self.settings)
 
         setup = ReshadeSetup(self.settings, folder, self.settings["Launcher"]["xxmi_feature_enabled"])
-        setup.verify_installation()
-        setup.addon_support()
-        setup.dxvk_support()
-        setup.xxmi_integration(game_code)
+        self.pipeline = LaunchPipeline([
+            ("verify_installation", "Verifying installation...", setup.verify_installation),
+            ("addon_support", "Updating ReShade...", setup.addon_support),
+            ("dxvk_support", "Preparing DirectX support...", setup.dxvk_support),
+            ("xxmi_integration", "Configuring XXMI...", lambda: setup.xxmi_integration(game_code)),
+            ("inject_game", "Waiting for the game to start...", lambda: setup.inject_game(job=self.pipeline.job)),
+        ])
+
+        self.nav_frame.grid_forget()
+        self.add_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.status_label.configure(text="Starting...")
+        self.status_frame.grid(row=1, column=0, pady=(10, 30), sticky="ew")
+        self.protocol("WM_DELETE_WINDOW", self.cancel_launch)
+
+        self.pipeline.start(self, self.launch_stage, self.launch_done)
+
+    def launch_stage(self, stage: dict):
+        self.status_label.configure(text=f"{stage['label']} ({stage['index']}/{stage['total']})")
+
+    def cancel_launch(self):
+        if self.pipeline:
+            self.pipeline.cancel()
+            self.status_label.configure(text="Cancelling...")
+            self.cancel_button.configure(state="disabled")
+
+    def launch_done(self, result: dict):
+        self.pipeline = None
+        if result.get("cancelled"):
+            self.status_frame.grid_forget()
+            self.nav_frame.grid(row=1, column=0, pady=(10, 30), sticky="ew")
+            self.add_button.configure(state="normal")
+            self.protocol("WM_DELETE_WINDOW", self.destroy)
+            return
 
-        result = setup.inject_game()
         self.destroy()
         if result["message"] != None:
             StyledPopup(title="Error", message=result["message"])
@@ -154,7 +199,7 @@ class GamePage(ctk.CTkFrame):
 
         for j, (game_id, game_data) in enumerate(self.page_games, start=1):
             name = game_data.get("display_name", game_id).replace("_", " ").title()
-            img_1 = ctk.CTkImage(PIL.Image.open(resource_path(game_data.get("icon_path", ""))), size=(128, 128))
+            img_1 = load_image(resource_path(game_data.get("icon_path", "")), (128, 128))
 
             launch_button = ctk.CTkButton(self, text="", image=img_1)
             launch_button.configure(width=128, height=128, corner_radius=8, fg_color="transparent")
@@ -254,7 +299,7 @@ class InputGame(ctk.CTkToplevel):
 
         # Container 1
         self.icon_image = resource_path("assets/icon/placeholder.png")
-        self.icon = ctk.CTkImage(PIL.Image.open(self.icon_image), size=(128, 128))
+        self.icon = load_image(self.icon_image, (128, 128))
         self.icon_preview = ctk.CTkLabel(self, text="", image=self.icon)
         self.icon_preview.grid(row=r, column=0, columnspan=2, pady=30, sticky="ew"); r += 1
 
@@ -307,7 +352,7 @@ class InputGame(ctk.CTkToplevel):
         if self.game_edit is not None:
             self.title("Edit Game")
             game_data = self.settings["Games"].get(self.game_edit, {})
-            loaded_icon = ctk.CTkImage(PIL.Image.open(resource_path(game_data.get("icon_path"))), size=(128, 128))
+            loaded_icon = load_image(resource_path(game_data.get("icon_path")), (128, 128))
             self.icon_preview.configure(image=loaded_icon)
             self.name_input.insert(0, game_data.get("display_name", game_edit.replace("_", " ").title()))
             self.path_entry.insert(0, str(Path(game_data.get("folder")) / game_data.get("exe")))
@@ -328,7 +373,7 @@ class InputGame(ctk.CTkToplevel):
 
         if icon_path:
             try:
-                new_icon = ctk.CTkImage(PIL.Image.open(resource_path(icon_path)), size=(128, 128))
+                new_icon = load_image(resource_path(icon_path), (128, 128))
                 self.icon_preview.configure(image=new_icon)
                 self.icon_source = icon_path
                 logger.info(f"Load selected icon: {icon_path}")
@@ -1,8 +1,11 @@
 """Defines the window for downloading dependencies with a progress bar"""
 
 import customtkinter as ctk
-import PIL.Image, threading, logging, sys
+import threading, logging, queue, sys
 from utils.path import resource_path
+from utils.progress import format_stats
+from utils.jobs import DownloadJob
+from utils.images import load_image
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +16,13 @@ class DownloadDialog(ctk.CTkToplevel):
         self.download_thread = download_thread
         self.message = message
         self.window_close = window_close
+        self.job = None
+        self.close_requested = False
+        self.progress_queue = queue.Queue()
 
         self.title("")
         self.resizable(width=False, height=False)
-        self.protocol("WM_DELETE_WINDOW", self.disable_close)
+        self.protocol("WM_DELETE_WINDOW", self.request_close)
         self.grab_set()
 
         # Center window on screen or over the master window
@@ -26,12 +32,12 @@ class DownloadDialog(ctk.CTkToplevel):
             spawn_y = int((self.winfo_screenheight() - self.height) / 2)
         else:
             spawn_x = int(self.master_window.winfo_width() * 0.5 + self.master_window.winfo_x() - 0.5 * 400 + 7)
-            spawn_y = int(self.master_window.winfo_height() * 0.5 + self.master_window.winfo_y() - 0.5 * 200 + 20)
+            spawn_y = int(self.master_window.winfo_height() * 0.5 + self.master_window.winfo_y() - 0.5 * 250 + 20)
         
         self.after(10)
-        self.geometry(f"400x200+{spawn_x}+{spawn_y}")
+        self.geometry(f"400x250+{spawn_x}+{spawn_y}")
 
-        self.download_icon = ctk.CTkImage(PIL.Image.open(resource_path("assets/icon/download.png")), size=(32, 32))
+        self.download_icon = load_image(resource_path("assets/icon/download.png"), (32, 32))
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure((0, 3), weight=1)
@@ -46,15 +52,55 @@ class DownloadDialog(ctk.CTkToplevel):
         self.progress_bar.configure(width=256, height=6)
         self.progress_bar.grid(row=3, column=0, pady=10)
 
+        self.stats_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(family="Verdana", size=12), text_color="gray60")
+        self.stats_label.grid(row=4, column=0, pady=(0, 10))
+
         self.button = ctk.CTkButton(self, text="Retry", font=ctk.CTkFont(family="Verdana", size=12, weight="bold"), command=self.run_download)
         self.button.configure(width=135, height=34, corner_radius=8, fg_color="#D8D8D8", text_color="#000000")
         self.button.grid_forget()
 
+        # Job controls
+        self.controls_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.controls_frame.grid_forget()
+
+        self.pause_button = ctk.CTkButton(self.controls_frame, text="Pause", font=ctk.CTkFont(family="Verdana", size=12, weight="bold"), command=self.toggle_pause)
+        self.pause_button.configure(width=110, height=34, corner_radius=8)
+        self.pause_button.grid(row=0, column=0, padx=5)
+
+        self.cancel_button = ctk.CTkButton(self.controls_frame, text="Cancel", font=ctk.CTkFont(family="Verdana", size=12, weight="bold"), command=self.cancel_download)
+        self.cancel_button.configure(width=110, height=34, corner_radius=8, fg_color="#E73B3C")
+        self.cancel_button.grid(row=0, column=1, padx=5)
+
         if self.download_thread:
             self.run_download()
 
-    def disable_close(self):
-        logger.warning("Cannot close window during download!")
+    def request_close(self):
+        if self.job is None:
+            self.app_close()
+            return
+        self.close_requested = True
+        self.cancel_download()
+
+    def cancel_download(self):
+        if self.job:
+            logger.info("Cancelling download...")
+            self.job.cancel()
+            self.title_label.configure(text="Cancelling...")
+            self.pause_button.configure(state="disabled")
+            self.cancel_button.configure(state="disabled")
+
+    def toggle_pause(self):
+        if not self.job:
+            return
+        if self.job.is_paused:
+            self.job.resume()
+            self.title_label.configure(text=self.message)
+            self.pause_button.configure(text="Pause")
+        else:
+            self.job.pause()
+            self.title_label.configure(text="Paused")
+            self.stats_label.configure(text="")
+            self.pause_button.configure(text="Resume")
 
     def app_close(self):
         if self.window_close:
@@ -64,31 +110,73 @@ class DownloadDialog(ctk.CTkToplevel):
             self.destroy()
 
     def run_download(self):
-        thread = threading.Thread(target=self.execute_download, daemon=True)
+        self.job = DownloadJob()
+        self.title_label.configure(text=self.message)
+        self.button.grid_forget()
+        self.pause_button.configure(text="Pause", state="normal")
+        self.cancel_button.configure(state="normal")
+        self.controls_frame.grid(row=5, column=0, pady=10)
+        self.protocol("WM_DELETE_WINDOW", self.request_close)
+
+        thread = threading.Thread(target=self.execute_download, args=(self.job,), daemon=True)
         thread.start()
+        self.after(100, self.poll_progress)
 
-    def execute_download(self):
+    def execute_download(self, job: DownloadJob):
         try:
-            self.title_label.configure(text=self.message)
-            self.button.grid_forget()
-            result = self.download_thread(self.update_progress)
-
-            if not result["status"]:
-                self.title_label.configure(text=result["message"])
-                self.progress_bar.set(0)
-                self.button.grid(row=4, column=0, pady=10)
-                self.protocol("WM_DELETE_WINDOW", self.app_close)
-            else:
-                self.after(500, self.destroy)
-
+            result = self.download_thread(self.update_progress, job)
         except Exception as e:
             logger.error(f"Error during download: {e}")
-            self.button.grid(row=4, column=0, pady=10)
-            self.protocol("WM_DELETE_WINDOW", self.app_close)
+            result = None
+        # Widgets are only touched from the Tk thread, poll_progress hands the result over
+        self.progress_queue.put(("done", result))
+
+    def download_finished(self, result: dict | None):
+        self.job = None
+        self.controls_frame.grid_forget()
 
-    def update_progress(self, value: float):
+        if result is None:
+            self.button.grid(row=5, column=0, pady=10)
+            self.protocol("WM_DELETE_WINDOW", self.app_close)
+        elif self.close_requested:
+            self.app_close()
+        elif not result["status"]:
+            self.title_label.configure(text=result["message"])
+            self.progress_bar.set(0)
+            self.button.grid(row=5, column=0, pady=10)
+            self.protocol("WM_DELETE_WINDOW", self.app_close)
+        else:
+            self.after(500, self.destroy)
+
+    def update_progress(self, value: float, stats: dict = None):
+        """Progress callback for the download workers; the Tk thread applies it in poll_progress."""
+        self.progress_queue.put(("progress", (value, stats)))
+
+    def poll_progress(self):
+        latest = finished = None
+        while True:
+            try:
+                kind, payload = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "done":
+                finished = (payload,)
+            else:
+                latest = payload
+        if latest:
+            self.show_progress(*latest)
+        if finished:
+            self.download_finished(*finished)
+        elif self.job is not None:
+            self.after(100, self.poll_progress)
+
+    def show_progress(self, value: float, stats: dict = None):
         if 0.0 <= value <= 1.0:
             self.progress_bar.set(value)
+            if stats and stats["rate"] and not (self.job and self.job.is_paused):
+                self.stats_label.configure(text=format_stats(stats))
+            elif value == 0.0 or value == 1.0:
+                self.stats_label.configure(text="")
             self.update_idletasks()
 
     def iconbitmap(self, bitmap):
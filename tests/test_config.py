@@ -0,0 +1,65 @@
+import copy, json
+import pytest
+from utils import config
+
+CUSTOM_GAME = {
+    "icon_path": "assets/icon/custom.png",
+    "folder": "D:/Games/Custom",
+    "exe": "Custom.exe",
+    "subpath": ""
+}
+
+def legacy_config() -> dict:
+    """A settings.json written before schema_version existed, with user additions."""
+    settings = copy.deepcopy(config.default)
+    del settings["schema_version"]
+    del settings["Launcher"]["cache_ttl"]
+    del settings["Packages"]["concurrency"]
+    settings["Launcher"]["gui_theme"] = "Ghost"
+    settings["Launcher"]["user_flag"] = True
+    settings["Games"]["custom_game"] = copy.deepcopy(CUSTOM_GAME)
+    return settings
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    path = tmp_path / "settings.json"
+    store = config.ConfigStore(path, delay=60)
+    monkeypatch.setattr(config, "config_path", path)
+    monkeypatch.setattr(config, "store", store)
+    yield store
+    store.cancel()
+
+
+def test_migration_keeps_user_keys():
+    settings = legacy_config()
+
+    assert config.migrate_config(settings)
+    assert settings["schema_version"] == config.SCHEMA_VERSION
+    assert settings["Games"]["custom_game"] == CUSTOM_GAME
+    assert settings["Launcher"]["user_flag"] is True
+    assert settings["Launcher"]["gui_theme"] == "Ghost"
+    assert settings["Launcher"]["cache_ttl"] == config.default["Launcher"]["cache_ttl"]
+    assert settings["Packages"]["concurrency"] == config.default["Packages"]["concurrency"]
+
+
+def test_legacy_config_is_migrated_and_saved(store):
+    config.config_path.write_text(json.dumps(legacy_config(), indent=4), encoding="utf-8")
+
+    settings = config.load_config()
+    store.flush()
+
+    saved = json.loads(config.config_path.read_text(encoding="utf-8"))
+    assert settings == saved
+    assert saved["schema_version"] == config.SCHEMA_VERSION
+    assert saved["Games"]["custom_game"] == CUSTOM_GAME
+
+
+def test_current_config_loads_without_write(store, monkeypatch):
+    settings = copy.deepcopy(config.default)
+    settings["Games"]["custom_game"] = copy.deepcopy(CUSTOM_GAME)
+    config.config_path.write_text(json.dumps(settings, indent=4), encoding="utf-8")
+    monkeypatch.setattr(config, "MIGRATIONS", [(config.SCHEMA_VERSION, lambda settings: pytest.fail("current config was migrated"))])
+
+    assert config.load_config() == settings
+    assert store.pending is None
@@ -0,0 +1,40 @@
+import os
+import pytest
+from utils.files import atomic_open, write_atomic
+
+def test_write_atomic_replaces_file(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("old", encoding="utf-8")
+
+    write_atomic(path, "néw")
+    write_atomic(tmp_path / "blob.bin", b"\x00\x01")
+
+    assert path.read_text(encoding="utf-8") == "néw"
+    assert (tmp_path / "blob.bin").read_bytes() == b"\x00\x01"
+    assert sorted(os.listdir(tmp_path)) == ["blob.bin", "settings.json"]
+
+
+def test_failed_write_keeps_original(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("old", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        with atomic_open(path) as file:
+            file.write("partial")
+            raise ValueError("interrupted")
+
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["settings.json"]
+
+
+def test_custom_replace(tmp_path):
+    path = tmp_path / "settings.json"
+    swaps = []
+    def replace(temp_path, target):
+        swaps.append(target)
+        os.replace(temp_path, target)
+
+    write_atomic(path, "data", fsync=False, replace=replace)
+
+    assert swaps == [path]
+    assert path.read_text(encoding="utf-8") == "data"
@@ -0,0 +1,50 @@
+import json
+from utils.fingerprint import DigestCache, compute_digest
+
+def test_unused_entries_are_dropped_on_save(tmp_path):
+    cache_path = tmp_path / "digests.json"
+    kept, removed = tmp_path / "kept.bin", tmp_path / "removed.bin"
+    kept.write_bytes(b"kept")
+    removed.write_bytes(b"removed")
+
+    cache = DigestCache(cache_path)
+    cache.digest(kept)
+    cache.digest(removed)
+    cache.save()
+    assert len(json.loads(cache_path.read_text(encoding="utf-8"))) == 2
+
+    removed.unlink()
+    cache = DigestCache(cache_path)
+    assert cache.digest(kept) == compute_digest(kept.resolve(), "sha256")
+    cache.save()
+
+    saved = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert list(saved) == [f"sha256:{kept.resolve()}"]
+
+
+def test_unchanged_cache_is_not_rewritten(tmp_path):
+    cache_path = tmp_path / "digests.json"
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"data")
+    DigestCache(cache_path).digest(path)
+
+    cache = DigestCache(cache_path)
+    cache.digest(path)
+    cache.save()
+    assert cache_path.exists()
+
+    mtime = cache_path.stat().st_mtime_ns
+    cache = DigestCache(cache_path)
+    cache.digest(path)
+    cache.save()
+    cache.save()
+    assert cache_path.stat().st_mtime_ns == mtime
+
+
+def test_cache_is_left_alone_when_never_loaded(tmp_path):
+    cache_path = tmp_path / "digests.json"
+    cache_path.write_text('{"sha256:/gone": {}}', encoding="utf-8")
+
+    DigestCache(cache_path).save()
+
+    assert cache_path.read_text(encoding="utf-8") == '{"sha256:/gone": {}}'
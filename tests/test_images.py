@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+PIL = pytest.importorskip("PIL.Image")
+
+from utils import images
+from utils.images import get_thumbnail
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, "thumb_roots", (tmp_path,))
+    return tmp_path
+
+
+def save(path, size, color="red"):
+    PIL.new("RGBA", size, color).save(path)
+    return path
+
+
+def test_source_that_fits_is_used_as_is(root):
+    icon = save(root / "icon.png", (128, 128))
+
+    assert get_thumbnail(icon, (128, 128)) == icon
+    assert get_thumbnail(icon, (64, 64)) == icon
+    assert not (root / images.thumb_dir).exists()
+
+
+def test_outside_thumb_roots_is_used_as_is(root, tmp_path_factory):
+    banner = save(tmp_path_factory.mktemp("user") / "banner.png", (1024, 1024))
+
+    assert get_thumbnail(banner, (64, 64)) == banner
+
+
+def test_thumbnail_is_reused_from_index(root, monkeypatch):
+    banner = save(root / "banner.png", (1024, 512))
+
+    thumb = get_thumbnail(banner, (128, 128))
+    assert thumb.parent == root / images.thumb_dir
+    with PIL.open(thumb) as image:
+        assert image.size == (256, 128)
+
+    monkeypatch.setattr(images, "source_sha", lambda path: pytest.fail("fresh index entry was hashed again"))
+    assert get_thumbnail(banner, (128, 128)) == thumb
+
+
+def test_changed_source_replaces_old_thumbnails(root):
+    banner = save(root / "banner.png", (1024, 1024))
+    small, large = get_thumbnail(banner, (64, 64)), get_thumbnail(banner, (128, 128))
+
+    save(banner, (1024, 1024), color="blue")
+    thumb = get_thumbnail(banner, (64, 64))
+
+    assert thumb != small
+    assert not small.exists() and not large.exists()
+    assert images.load_thumb_index(root / images.thumb_dir)["banner.png"]["sha"] == images.source_sha(banner)
@@ -0,0 +1,77 @@
+from utils.ini import patch_ini, read_ini
+
+RESHADE_INI = (
+    b"; ReShade settings\r\n"
+    b"[GENERAL]\r\n"
+    b"EffectSearchPaths = .\\reshade-shaders\\Shaders\r\n"
+    b"PresetPath=.\\ReShadePreset.ini\r\n"
+    b"# keep this comment\r\n"
+    b"\r\n"
+    b"[OVERLAY]\r\n"
+    b"Docking=[Window][Home],0,0\r\n"
+)
+
+def write(tmp_path, data: bytes):
+    path = tmp_path / "ReShade.ini"
+    path.write_bytes(data)
+    return path
+
+
+def test_changed_keys_keep_spacing_and_line_endings(tmp_path):
+    path = write(tmp_path, RESHADE_INI)
+
+    assert patch_ini(path, "GENERAL", {"EffectSearchPaths": "C:\\Shaders", "PresetPath": "C:\\Preset.ini"})
+
+    assert path.read_bytes() == RESHADE_INI.replace(
+        b".\\reshade-shaders\\Shaders", b"C:\\Shaders"
+    ).replace(b".\\ReShadePreset.ini", b"C:\\Preset.ini")
+    assert read_ini(path, "GENERAL", ["EffectSearchPaths"]) == {"EffectSearchPaths": "C:\\Shaders"}
+
+
+def test_comments_and_other_sections_are_untouched(tmp_path):
+    path = write(tmp_path, RESHADE_INI)
+
+    patch_ini(path, "GENERAL", {"PresetPath": "C:\\Preset.ini"})
+
+    data = path.read_bytes()
+    assert data.startswith(b"; ReShade settings\r\n")
+    assert b"# keep this comment\r\n\r\n[OVERLAY]\r\nDocking=[Window][Home],0,0\r\n" in data
+    assert read_ini(path, "OVERLAY", ["Docking"]) == {"Docking": "[Window][Home],0,0"}
+
+
+def test_missing_keys_are_appended_inside_section(tmp_path):
+    path = write(tmp_path, RESHADE_INI)
+
+    patch_ini(path, "GENERAL", {"TextureSearchPaths": "C:\\Textures"})
+
+    assert path.read_bytes() == RESHADE_INI.replace(
+        b"# keep this comment\r\n", b"# keep this comment\r\nTextureSearchPaths=C:\\Textures\r\n"
+    )
+
+
+def test_missing_section_is_appended(tmp_path):
+    path = write(tmp_path, b"[OVERLAY]\nDocking=1\n")
+
+    patch_ini(path, "GENERAL", {"PresetPath": "C:\\Preset.ini"})
+
+    assert path.read_bytes() == b"[OVERLAY]\nDocking=1\n\n[GENERAL]\nPresetPath=C:\\Preset.ini\n"
+
+
+def test_missing_section_after_unterminated_line(tmp_path):
+    path = write(tmp_path, b"[OVERLAY]\nA=1")
+
+    patch_ini(path, "GENERAL", {"B": "2"})
+
+    assert path.read_bytes() == b"[OVERLAY]\nA=1\n\n[GENERAL]\nB=2\n"
+
+
+def test_same_values_do_not_rewrite(tmp_path):
+    path = write(tmp_path, RESHADE_INI)
+    values = {"EffectSearchPaths": "C:\\Shaders", "TextureSearchPaths": "C:\\Textures"}
+    assert patch_ini(path, "GENERAL", values)
+    mtime = path.stat().st_mtime_ns
+    data = path.read_bytes()
+
+    assert patch_ini(path, "GENERAL", values) is False
+    assert path.stat().st_mtime_ns == mtime
+    assert path.read_bytes() == data
@@ -0,0 +1,106 @@
+import time
+import pytest
+from requests.exceptions import HTTPError
+from utils import manifest
+from utils.manifest import sync_plan
+from utils.scheduler import RateLimitState, RequestScheduler
+
+class Response:
+    headers = {"ETag": '"tree"'}
+
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} Error", response=self)
+
+    def json(self):
+        return self.body
+
+
+class Session:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        return Response(self.body, self.status_code)
+
+
+def tracked(download_dir, *names) -> dict:
+    index = {"files": {}}
+    for name in names:
+        path = download_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("preset", encoding="utf-8")
+        index["files"][name] = {"sha": "old", "size": 6, "mtime_ns": 0}
+    return index
+
+
+def test_truncated_tree_is_recorded(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest, "manifest_path", tmp_path / "manifest.json")
+    body = {"sha": "abc", "truncated": True, "tree": [{"path": "res/Presets/A/a.ini", "type": "blob", "sha": "1", "size": 1}]}
+
+    fetched = manifest.fetch_manifest("owner", "repo", "res", session=Session(body))
+
+    assert fetched["truncated"] is True
+    assert list(fetched["files"]) == ["A/a.ini"]
+
+
+@pytest.fixture
+def paused(tmp_path, monkeypatch):
+    """A cached manifest and an api.github.com rate limit that resets in an hour."""
+    monkeypatch.setattr(manifest, "manifest_path", tmp_path / "manifest.json")
+    cached = {"source": "owner/repo@main", "prefix": "res/Presets/", "etag": '"old"', "files": {"A/a.ini": {"sha": "1", "size": 1}}}
+    manifest.save_manifest(cached)
+
+    limits = RateLimitState()
+    limits.paused_until["api.github.com"] = time.time() + 3600
+    sleeps = []
+    return cached, RequestScheduler(limits=limits, max_wait=60, sleep=sleeps.append), sleeps
+
+
+def test_conditional_request_skips_rate_limit_pause(paused):
+    cached, scheduler, sleeps = paused
+    session = Session({}, status_code=304)
+
+    assert manifest.fetch_manifest("owner", "repo", "res", session=session, scheduler=scheduler) == cached
+    assert session.requests[0]["If-None-Match"] == '"old"'
+    assert sleeps == []
+
+
+def test_rate_limited_request_falls_back_to_cache(paused):
+    cached, scheduler, sleeps = paused
+    session = Session({}, status_code=429)
+
+    assert manifest.fetch_manifest("owner", "repo", "res", session=session, scheduler=scheduler) == cached
+    assert len(session.requests) == 1
+    assert sleeps == []
+
+
+def test_remote_deletion_is_pruned(tmp_path):
+    index = tracked(tmp_path, "A/gone.ini")
+
+    assert sync_plan([], index, ["A"], tmp_path) == []
+    assert not (tmp_path / "A/gone.ini").exists()
+    assert index["files"] == {}
+
+
+def test_incomplete_manifest_skips_pruning(tmp_path):
+    index = tracked(tmp_path, "A/missing.ini")
+
+    sync_plan([], index, ["A"], tmp_path, prune=False)
+
+    assert (tmp_path / "A/missing.ini").exists()
+    assert "A/missing.ini" in index["files"]
+
+
+def test_missing_presets_are_reported():
+    fetched = {"files": {"A/a.ini": {}, "A/textures/t.png": {}, "B/b.ini": {}}}
+
+    assert manifest.missing_presets(fetched, ["A", "C", "B", "a"]) == ["C", "a"]
+    assert manifest.missing_presets({}, ["A"]) == ["A"]
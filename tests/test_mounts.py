@@ -0,0 +1,93 @@
+import ctypes, types
+from utils import mounts
+from utils.mounts import MountIndex, UNKNOWN, normalize
+
+WINDOWS = [("C:\\", "NTFS"), ("D:\\", "exFAT"), ("E:\\", ""), ("C:\\Mount\\Games\\", "ReFS")]
+LINUX = [("/", "ext4"), ("/home", "btrfs"), ("/mnt/games", "ntfs3"), ("/mnt/games/cache", "tmpfs")]
+
+class Table:
+    """Synthetic mount table whose signature only changes when `version` is bumped."""
+    def __init__(self, partitions):
+        self.partitions = list(partitions)
+        self.version = 0
+        self.reads = 0
+
+    def provider(self):
+        self.reads += 1
+        return self.partitions
+
+    def signature(self):
+        return self.version
+
+
+def index_for(partitions):
+    table = Table(partitions)
+    return MountIndex(table.provider, table.signature), table
+
+
+def test_windows_drives_and_mount_folders():
+    index, _ = index_for(WINDOWS)
+
+    assert index.filesystem("C:\\Program Files\\Game\\Game.exe") == "NTFS"
+    assert index.filesystem("c:/mount/games/Genshin") == "REFS"
+    assert index.filesystem("C:\\Mount\\Gamesaves") == "NTFS"
+    assert index.filesystem("D:\\Games") == "EXFAT"
+    # Drives without a filesystem (e.g. an empty card reader) and unknown drives are not matched
+    assert index.filesystem("E:\\Games") == UNKNOWN
+    assert index.filesystem("Z:\\Games") == UNKNOWN
+
+
+def test_linux_longest_prefix():
+    index, _ = index_for(LINUX)
+
+    assert index.filesystem("/mnt/games/Genshin/GenshinImpact.exe") == "NTFS3"
+    assert index.filesystem("/mnt/games/cache/shaders") == "TMPFS"
+    assert index.filesystem("/mnt/gamesaves") == "EXT4"
+    assert index.filesystem("/home/user/Games") == "BTRFS"
+    assert index.filesystem("/") == "EXT4"
+
+
+def test_rebuilds_only_when_signature_changes():
+    index, table = index_for(LINUX)
+    index.filesystem("/home")
+    index.filesystem("/mnt/games")
+    assert table.reads == 1
+
+    table.partitions.append(("/media/usb", "vfat"))
+    assert index.filesystem("/media/usb/Game") == "EXT4"
+
+    table.version += 1
+    assert index.filesystem("/media/usb/Game") == "VFAT"
+    assert table.reads == 2
+
+
+def test_missing_signature_always_rebuilds():
+    table = Table(LINUX)
+    index = MountIndex(table.provider, lambda: None)
+    index.filesystem("/home")
+    index.filesystem("/home")
+
+    assert table.reads == 2
+
+
+def test_normalize_folds_spellings():
+    assert normalize("C:\\Games\\") == normalize("c:/games") == "c:/games"
+    assert normalize("/mnt/") == "/mnt"
+    assert normalize("/") == "/"
+
+
+def test_windows_signature_without_listdrives(monkeypatch):
+    drives = [0b1100]
+    kernel32 = types.SimpleNamespace(GetLogicalDrives=lambda: drives[0])
+    monkeypatch.setattr(mounts, "os", types.SimpleNamespace(name="nt"))
+    monkeypatch.setattr(ctypes, "windll", types.SimpleNamespace(kernel32=kernel32), raising=False)
+
+    table = Table(WINDOWS)
+    index = MountIndex(table.provider, mounts.mount_signature)
+    index.filesystem("C:\\Games")
+    index.filesystem("D:\\Games")
+    assert table.reads == 1
+
+    drives[0] |= 0b10000
+    index.filesystem("C:\\Games")
+    assert table.reads == 2
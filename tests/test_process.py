@@ -0,0 +1,156 @@
+import copy, subprocess, sys, time, types
+import pytest
+from utils import config
+from utils.injector import ReshadeSetup
+from utils.jobs import DownloadJob, JobCancelled
+from utils.process import FakeBackend, ProcessBackend, PymemBackend
+
+@pytest.fixture
+def backend():
+    backend = FakeBackend()
+    backend.interval = 0
+    return backend
+
+
+def test_backend_requires_the_process_methods():
+    with pytest.raises(TypeError):
+        ProcessBackend()
+
+
+def test_direct_launch_attaches_to_spawned_pid(backend):
+    pid = backend.spawn(["Game.exe"], cwd=".", env={})
+
+    assert backend.wait_for_target(pid, "Game.exe", timeout=1) == pid
+    assert backend.spawned[0]["args"] == ["Game.exe"]
+
+
+def test_launcher_stub_attaches_to_child(backend):
+    backend.ready_after = 3
+    backend.child_pid = 4242
+    pid = backend.spawn(["Launcher.exe"], cwd=".", env={})
+
+    assert backend.wait_for_target(pid, "Game.exe", timeout=1) == 4242
+    assert backend.ready_after == 0
+
+
+def test_timeout_returns_none(backend):
+    backend.ready_after = 10 ** 9
+    pid = backend.spawn(["Game.exe"], cwd=".", env={})
+
+    assert backend.wait_for_target(pid, "Game.exe", timeout=0.05) is None
+
+
+def test_cancel_stops_waiting(backend):
+    backend.ready_after = 10 ** 9
+    backend.interval = 60
+    job = DownloadJob()
+    job.cancel()
+
+    with pytest.raises(JobCancelled):
+        backend.wait_for_target(1, "Game.exe", timeout=60, job=job)
+
+
+@pytest.fixture
+def setup(tmp_path):
+    game_dir = tmp_path / "Game"
+    game_dir.mkdir()
+    (game_dir / "ReShade.ini").write_text("[GENERAL]\n", encoding="utf-8")
+
+    setup = ReshadeSetup(copy.deepcopy(config.default), str(game_dir), xxmi_enabled=False)
+    setup.game_dir = game_dir
+    setup.exe_path = game_dir / "Game.exe"
+    setup.direct_enabled = False
+    return setup
+
+
+def test_inject_game_injects_into_target(setup, backend):
+    backend.child_pid = 4242
+
+    assert setup.inject_game(timeout=1, backend=backend) == {"message": None}
+    assert backend.spawned[0]["env"]["RESHADE_DISABLE_LOADING_CHECK"] == "1"
+    assert backend.injected == [(4242, str(setup.reshade_dll))]
+
+
+def test_inject_game_reports_timeout_and_failed_injection(setup, backend):
+    backend.ready_after = 10 ** 9
+    assert setup.inject_game(timeout=0.05, backend=backend)["message"]
+    assert not backend.injected
+
+    backend.ready_after = 0
+    backend.fail_inject = True
+    assert setup.inject_game(timeout=1, backend=backend)["message"]
+
+
+class Exited:
+    """Popen stand-in for a launcher stub that already handed off and exited."""
+    def poll(self):
+        return 0
+
+
+def process(pid, ppid, name, create_time):
+    return types.SimpleNamespace(info={"pid": pid, "ppid": ppid, "name": name, "create_time": create_time})
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    psutil = pytest.importorskip("psutil")
+    table = []
+
+    def missing(pid):
+        raise psutil.NoSuchProcess(pid)
+
+    monkeypatch.setattr(psutil, "Process", missing)
+    monkeypatch.setattr(psutil, "process_iter", lambda attrs=None: list(table))
+    return table
+
+
+def test_tree_walk_finds_game_of_exited_stub(processes):
+    backend = PymemBackend()
+    backend.started[10] = (Exited(), 1000.0)
+    processes += [
+        process(5, 1, "Game.exe", 900.0),
+        process(10, 1, "Launcher.exe", 1000.0),
+        process(20, 10, "Bootstrap.exe", 1001.0),
+        process(40, 1, "Game.exe", 1002.5),
+    ]
+    # Neither the instance that was already running nor one outside the stub's tree is picked
+    assert backend.find_target(10, "Game.exe") is None
+
+    # The bootstrap exits too, the tree remembered from the last scan still leads to the game
+    processes[:] = [process(5, 1, "Game.exe", 900.0), process(30, 20, "game.EXE", 1003.0), process(40, 1, "Game.exe", 1002.5)]
+    assert backend.find_target(10, "Game.exe") == 30
+
+
+def test_reused_pid_in_tree_is_ignored(processes):
+    backend = PymemBackend()
+    backend.started[10] = (Exited(), 1000.0)
+    processes += [process(20, 10, "Game.exe", 500.0)]
+
+    assert backend.find_target(10, "Game.exe") is None
+
+
+def test_pause_wakes_up_when_stub_exits():
+    backend = PymemBackend()
+    stub = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    backend.started[stub.pid] = (stub, time.time())
+
+    start = time.monotonic()
+    backend.pause(stub.pid, 10)
+
+    assert time.monotonic() - start < 5
+    assert stub.poll() == 0
+
+
+def test_pause_on_running_stub_honours_cancel():
+    backend = PymemBackend()
+    stub = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    backend.started[stub.pid] = (stub, time.time())
+    job = DownloadJob()
+    job.cancel()
+
+    try:
+        with pytest.raises(JobCancelled):
+            backend.pause(stub.pid, 0.05, job)
+    finally:
+        stub.kill()
+        stub.wait()
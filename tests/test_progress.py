@@ -0,0 +1,73 @@
+import pytest
+from utils import progress
+from utils.jobs import DownloadJob
+from utils.progress import ProgressTracker
+
+MB = 1_000_000
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(progress.time, "monotonic", clock)
+    return clock
+
+
+def run(tracker, clock, done, skipped=0, seconds=1.0):
+    clock.now += seconds
+    tracker.update(done, 100 * MB, skipped)
+    tracker.report(force=True)
+    return tracker.rate
+
+
+def test_resumed_bytes_do_not_count_as_throughput(clock):
+    tracker = ProgressTracker()
+    tracker.start_stage("download", 0)
+
+    for second in range(1, 6):
+        rate = run(tracker, clock, 90 * MB + second * MB, skipped=90 * MB)
+
+    assert rate == pytest.approx(MB)
+
+
+def test_skipped_members_do_not_count_as_throughput(clock):
+    tracker = ProgressTracker()
+    tracker.start_stage("extract", 0)
+
+    run(tracker, clock, 50 * MB, skipped=50 * MB, seconds=0)
+    rate = run(tracker, clock, 52 * MB, skipped=50 * MB)
+
+    assert rate == pytest.approx(2 * MB)
+
+
+def test_pause_restarts_the_sample(clock):
+    job = DownloadJob()
+    tracker = ProgressTracker(job=job)
+    tracker.start_stage("download", 0)
+    run(tracker, clock, 1 * MB)
+
+    job.pause()
+    clock.now += 60
+    job.resume()
+    run(tracker, clock, 2 * MB, seconds=0)
+    rate = run(tracker, clock, 3 * MB)
+
+    assert rate == pytest.approx(MB)
+
+
+def test_stage_starts_from_existing_work(clock):
+    tracker = ProgressTracker()
+    tracker.start_stage("presets", 100 * MB, done=40 * MB)
+
+    clock.now += 1
+    tracker.advance(MB)
+    tracker.report(force=True)
+
+    assert tracker.rate == pytest.approx(MB)
@@ -0,0 +1,132 @@
+import threading
+import pytest, requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests.exceptions import HTTPError
+from utils import scheduler
+from utils.scheduler import RateLimitState, RequestScheduler
+
+class Clock:
+    """Stands in for time.time and the scheduler's sleep, so waits advance time instantly."""
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer with the scripted (status, headers) responses in turn, then 200."""
+    def do_GET(self):
+        status, headers = self.server.script.pop(0) if self.server.script else (200, {})
+        self.server.requests += 1
+        body = b"ok" if status == 200 else b"error"
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.script, server.requests = [], 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scheduler.time, "time", clock)
+    # Full jitter always picks the upper bound
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+    return clock
+
+
+@pytest.fixture
+def client(server, clock):
+    """A session hooked to its own RateLimitState, as get_session() hooks the shared one."""
+    limits = RateLimitState()
+    session = requests.Session()
+    session.hooks["response"].append(limits.observe)
+    url = f"http://127.0.0.1:{server.server_address[1]}/repos/owner/repo"
+
+    def request():
+        response = session.get(url, timeout=5)
+        response.raise_for_status()
+        return response.text
+
+    yield url, request, limits
+    session.close()
+
+
+def test_rate_limit_and_retry_after_sequence(server, clock, client):
+    url, request, limits = client
+    server.script = [
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"}),
+        (429, {"Retry-After": "2"}),
+        (503, {}),
+    ]
+
+    assert RequestScheduler(limits=limits, sleep=clock.sleep).run(url, request) == "ok"
+    assert server.requests == 4
+    # backoff 0.5, reset wait 9.5, backoff 1.0, Retry-After wait 1.0, backoff 2.0
+    assert clock.sleeps == [0.5, 9.5, 1.0, 1.0, 2.0]
+
+
+def test_plain_forbidden_is_not_retried(server, clock, client):
+    url, request, limits = client
+    server.script = [(403, {})]
+
+    with pytest.raises(HTTPError):
+        RequestScheduler(limits=limits, sleep=clock.sleep).run(url, request)
+    assert server.requests == 1
+    assert clock.sleeps == []
+
+
+def test_retries_are_bounded(server, clock, client):
+    url, request, limits = client
+    server.script = [(503, {})] * 5
+
+    with pytest.raises(HTTPError):
+        RequestScheduler(retries=2, limits=limits, sleep=clock.sleep).run(url, request)
+    assert server.requests == 3
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_pause_longer_than_max_wait_raises(server, clock, client):
+    url, request, limits = client
+    server.script = [(429, {"Retry-After": "600"})]
+    with pytest.raises(HTTPError):
+        RequestScheduler(retries=0, limits=limits, sleep=clock.sleep).run(url, request)
+
+    with pytest.raises(HTTPError):
+        RequestScheduler(limits=limits, max_wait=60, sleep=clock.sleep).run(url, request)
+    assert server.requests == 1
+    assert clock.sleeps == []
+
+
+def test_cached_request_skips_pause_and_retries(server, clock, client):
+    url, request, limits = client
+    server.script = [(429, {"Retry-After": "600"}), (503, {})]
+    with pytest.raises(HTTPError):
+        RequestScheduler(retries=0, limits=limits, sleep=clock.sleep).run(url, request)
+
+    with pytest.raises(HTTPError):
+        RequestScheduler(limits=limits, max_wait=60, sleep=clock.sleep).run(url, request, cached=True)
+    assert server.requests == 2
+    assert clock.sleeps == []
@@ -0,0 +1,40 @@
+import pytest
+from utils.theme import ThemeManager
+
+@pytest.fixture
+def themes(tmp_path, monkeypatch):
+    monkeypatch.setattr(ThemeManager, "index", {})
+    monkeypatch.setattr(ThemeManager, "data", {})
+    monkeypatch.setattr(ThemeManager, "current_theme_path", None)
+    for name in ("Default", "Custom"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "theme.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "Default" / "logo-home.png").write_bytes(b"png")
+    return tmp_path
+
+
+def test_images_resolve_regardless_of_case(themes):
+    (themes / "Custom" / "Logo-Home.JPG").write_bytes(b"jpg")
+    (themes / "Custom" / "background.PNG").write_bytes(b"png")
+    ThemeManager(themes).load_theme("Custom")
+
+    assert ThemeManager.get_images("logo-home").lower() == str(themes / "Custom" / "logo-home.jpg").lower()
+    assert ThemeManager.get_images("background").lower() == str(themes / "Custom" / "background.png").lower()
+
+
+def test_missing_image_falls_back_to_default_theme(themes):
+    ThemeManager(themes).load_theme("Custom")
+
+    assert ThemeManager.get_images("logo-home") is None
+    assert ThemeManager.find_image(themes / "Default" / "logo-home") == themes / "Default" / "logo-home.png"
+
+
+def test_index_follows_new_files(themes):
+    manager = ThemeManager(themes)
+    manager.load_theme("Custom")
+    assert ThemeManager.get_images("logo-home") is None
+
+    (themes / "Custom" / "logo-home.png").write_bytes(b"png")
+    manager.load_theme("Custom")
+
+    assert ThemeManager.get_images("logo-home") == str(themes / "Custom" / "logo-home.png")
@@ -0,0 +1,128 @@
+import threading
+import pytest, requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils import scheduler
+from utils.transfer import download_resumable
+
+PAYLOAD = bytes(range(256)) * 1024
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve PAYLOAD with Range support, dropping the first response after `drop_at` bytes.
+
+    Statuses queued in `errors` are answered first, one per request.
+    """
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.errors:
+            self.send_response(server.errors.pop(0))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start = 0
+        if self.headers.get("Range") and self.headers.get("If-Range") == server.etag:
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+        body = server.payload[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+
+        if server.drop_at is not None:
+            self.wfile.write(body[:server.drop_at])
+            server.drop_at = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.payload, server.etag, server.drop_at, server.requests, server.errors = PAYLOAD, '"v1"', None, [], []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/bundle.zip"
+
+
+def test_dropped_connection_resumes_with_range(server, tmp_path):
+    server.drop_at = 131_072
+    output = tmp_path / "bundle.zip"
+    reports = []
+
+    download_resumable(url(server), output, session=requests.Session(), progress_callback=lambda *args: reports.append(args))
+
+    assert output.read_bytes() == PAYLOAD
+    assert not (tmp_path / "bundle.zip.part").exists()
+    assert not (tmp_path / "bundle.zip.part.json").exists()
+
+    first, second = server.requests
+    assert "Range" not in first
+    assert second["Range"] == "bytes=131072-"
+    assert second["If-Range"] == '"v1"'
+    # The dropped attempt moved its bytes in this run, so none of them are skipped
+    assert reports[-1] == (len(PAYLOAD), len(PAYLOAD), 0)
+
+
+def test_later_run_reports_partial_file_as_skipped(server, tmp_path):
+    server.drop_at = 131_072
+    output = tmp_path / "bundle.zip"
+    session = requests.Session()
+    reports = []
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        download_resumable(url(server), output, session=session, retries=1)
+    download_resumable(url(server), output, session=session, progress_callback=lambda *args: reports.append(args))
+
+    assert output.read_bytes() == PAYLOAD
+    assert reports[0][2] == reports[-1][2] == 131_072
+
+
+def test_changed_remote_restarts_download(server, tmp_path):
+    server.drop_at = 131_072
+    output = tmp_path / "bundle.zip"
+    session = requests.Session()
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        download_resumable(url(server), output, session=session, retries=1)
+    assert (tmp_path / "bundle.zip.part").stat().st_size == 131_072
+
+    server.payload, server.etag = PAYLOAD[::-1], '"v2"'
+    download_resumable(url(server), output, session=session)
+
+    assert output.read_bytes() == PAYLOAD[::-1]
+    assert server.requests[-1]["If-Range"] == '"v1"'
+
+
+def test_server_errors_are_retried_with_backoff(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+    server.errors = [503, 502]
+    server.drop_at = 131_072
+    sleeps = []
+
+    download_resumable(url(server), tmp_path / "bundle.zip", session=requests.Session(), sleep=sleeps.append)
+
+    assert (tmp_path / "bundle.zip").read_bytes() == PAYLOAD
+    assert len(server.requests) == 4
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+def test_client_errors_are_not_retried(server, tmp_path):
+    server.errors = [404]
+    sleeps = []
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        download_resumable(url(server), tmp_path / "bundle.zip", session=requests.Session(), sleep=sleeps.append)
+    assert len(server.requests) == 1
+    assert sleeps == []
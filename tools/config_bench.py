@@ -0,0 +1,67 @@
+"""Benchmark load_config for settings files with many custom games
+
+Usage: python tools/config_bench.py [--games 10 100 1000] [--runs 50]
+"""
+
+import argparse, copy, json, sys, tempfile, time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+
+from utils import config
+
+def make_config(games: int, current: bool) -> dict:
+    settings = copy.deepcopy(config.default)
+    for i in range(games):
+        settings["Games"][f"custom_game_{i}"] = {
+            "icon_path": "assets/icon/placeholder.png",
+            "folder": f"C:/Games/Custom Game {i}",
+            "exe": f"CustomGame{i}.exe",
+            "subpath": ""
+        }
+    if not current:
+        # A pre-versioning file, missing the newer keys
+        del settings["schema_version"]
+        del settings["Launcher"]["cache_ttl"]
+        del settings["Packages"]["concurrency"]
+    return settings
+
+
+def measure(path: Path, settings: dict, runs: int) -> float:
+    config.config_path = config.store.path = path
+    text = json.dumps(settings, indent=4, ensure_ascii=False)
+
+    timings = []
+    for _ in range(runs):
+        path.write_text(text, encoding="utf-8")
+        start = time.perf_counter()
+        loaded = config.load_config()
+        timings.append(time.perf_counter() - start)
+        config.store.cancel()
+
+        # Migration must keep every custom game
+        if loaded["Games"].keys() != settings["Games"].keys():
+            sys.exit("load_config dropped games from the settings")
+
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'games':>8} {'current':>12} {'migrated':>12}  (median of {args.runs} runs)")
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "settings.json"
+        for games in args.games:
+            current = measure(path, make_config(games, True), args.runs)
+            migrated = measure(path, make_config(games, False), args.runs)
+            print(f"{games:>8} {current:>10.3f}ms {migrated:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Report the cold-start import cost of the launcher using `python -X importtime`
+
+Only `import <module>` is timed, so the `__main__` startup path of app.py (config, theme, window
+and the imports it defers) is not included; run `python app.py --trace` to profile that.
+
+Usage: python tools/import_report.py [module] [--top N]
+"""
+
+import argparse, subprocess, sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+
+def measure(module: str) -> list[tuple[int, int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="app")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    top_level = [row for row in rows if not row[2].startswith(" ")]
+    total_ms = sum(row[1] for row in top_level) / 1000
+
+    print(f"Cold import of '{args.module}': {total_ms:.1f} ms, {len(rows)} modules")
+    print("Module import only, the __main__ startup path is not run (profile it with `python app.py --trace`)\n")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name.strip()}")
+
+    # Modules that should only load after a click
+    deferred = ("requests", "pymem", "psutil", "packaging", "win32api", "gui.settings_window", "gui.launcher_window", "gui.presets_window", "gui.update_window", "utils.downloader")
+    loaded = sorted({name.strip() for _, _, name in rows if name.strip() in deferred})
+    print(f"\nDeferred modules loaded on import: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
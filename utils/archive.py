@@ -0,0 +1,88 @@
+"""Utils for all related to extracting downloaded archives"""
+
+import zipfile, logging, threading
+from pathlib import Path
+from utils.transfer import run_pool, DEFAULT_CONCURRENCY
+from utils.fingerprint import file_digest, digest_cache
+from utils.files import atomic_open
+
+logger = logging.getLogger(__name__)
+
+def file_crc32(path: Path) -> int:
+    return int(file_digest(path, "crc32"), 16)
+
+
+def is_extracted(info: zipfile.ZipInfo, target: Path) -> bool:
+    """Compare a member with the file on disk using the size and CRC32 from the central directory."""
+    try:
+        if target.stat().st_size != info.file_size:
+            return False
+    except OSError:
+        return False
+    return file_crc32(target) == info.CRC
+
+
+def member_target(info: zipfile.ZipInfo, destination: Path) -> Path:
+    target = (destination / info.filename).resolve()
+    if not target.is_relative_to(destination):
+        raise zipfile.BadZipFile(f"Unsafe path in archive: {info.filename}")
+    return target
+
+
+def extract_incremental(zip_path, destination, max_workers=DEFAULT_CONCURRENCY, progress_callback=None, job=None) -> dict:
+    """Extract only the members that are missing or differ on disk, spread across a worker pool.
+
+    progress_callback(done_bytes, total_bytes, skipped_bytes) is reported by uncompressed member size,
+    skipped_bytes being the members that were already up to date.
+    """
+    destination = Path(destination).resolve()
+    local = threading.local()
+    handles = []
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        members = [info for info in zip_ref.infolist() if not info.is_dir()]
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                member_target(info, destination).mkdir(parents=True, exist_ok=True)
+
+    def extract(info: zipfile.ZipInfo) -> bool:
+        if job:
+            job.wait_if_paused()
+        target = member_target(info, destination)
+        if is_extracted(info, target):
+            return False
+
+        # ZipFile handles are not safe to share between threads, every worker opens its own
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            handles.append(local.zip_ref)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_open(target, "wb", fsync=False) as temp, local.zip_ref.open(info) as source:
+            while chunk := source.read(1024 * 1024):
+                temp.write(chunk)
+        return True
+
+    total_bytes = sum(info.file_size for info in members)
+    done_bytes = skipped_bytes = 0
+    def member_done(info, extracted):
+        nonlocal done_bytes, skipped_bytes
+        done_bytes += info.file_size
+        if not extracted:
+            skipped_bytes += info.file_size
+        if progress_callback and total_bytes:
+            progress_callback(done_bytes, total_bytes, skipped_bytes)
+
+    try:
+        results = run_pool(members, extract, max_workers, on_done=member_done)
+    finally:
+        for handle in handles:
+            handle.close()
+        digest_cache.save()
+
+    extracted = sum(results)
+    logger.info(f"Extracted {extracted} files, {len(members) - extracted} already up to date")
+    return {
+        "extracted": extracted,
+        "skipped": len(members) - extracted
+    }
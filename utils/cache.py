@@ -0,0 +1,71 @@
+"""Utils for all related to the on-disk HTTP cache"""
+
+import os, json, time, hashlib, logging
+from pathlib import Path
+from requests.exceptions import RequestException
+from utils.path import resource_path
+from utils.transfer import get_session
+from utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+cache_dir = resource_path("cache/http")
+DEFAULT_TTL = 3600
+
+def _entry_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.json", cache_dir / f"{key}.body"
+
+
+def cached_get(url, ttl: int = DEFAULT_TTL, session=None, headers=None, timeout=10) -> bytes:
+    """Return the body of url, revalidating the cached copy with If-None-Match / If-Modified-Since.
+
+    Inside the ttl window (seconds) the cached body is returned without touching the network, and a
+    stale copy is still served when the request fails.
+    """
+    session = session or get_session()
+    meta_path, body_path = _entry_paths(url)
+
+    meta = {}
+    if meta_path.is_file() and body_path.is_file():
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+        except json.JSONDecodeError:
+            meta = {}
+
+    if meta and time.time() - meta.get("fetched_at", 0) < ttl:
+        logger.debug(f"HTTP cache fresh: {url}")
+        return body_path.read_bytes()
+
+    request_headers = dict(headers or {})
+    if meta.get("etag"):
+        request_headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and meta:
+            logger.debug(f"HTTP cache revalidated: {url}")
+            body = body_path.read_bytes()
+        else:
+            response.raise_for_status()
+            body = response.content
+            meta = {
+                "url": url,
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+            }
+            os.makedirs(cache_dir, exist_ok=True)
+            write_atomic(body_path, body)
+
+    except RequestException as e:
+        if not meta:
+            raise
+        logger.warning(f"Serving stale cache for {url}: {e}")
+        return body_path.read_bytes()
+
+    meta["fetched_at"] = time.time()
+    write_atomic(meta_path, json.dumps(meta))
+    return body
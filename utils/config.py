@@ -1,14 +1,22 @@
 """Utils for all related to the configuration file"""
 
-import os, json, copy
-import win32security, ntsecuritycon
+import os, json, copy, atexit, logging, threading
+from pathlib import Path
 from utils.path import resource_path
+from utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
 
 config_path = resource_path("settings.json")
+# Saves arriving within this window are coalesced into one write
+SAVE_DELAY = 0.5
+SCHEMA_VERSION = 1
 
 default = {
+    "schema_version": SCHEMA_VERSION,
     "Launcher": {
         "auto_check_update": True,
+        "cache_ttl": 3600,
         "gui_theme": "Default",
         "last_played_game": "",
         "xxmi_feature_enabled": False,
@@ -17,7 +25,8 @@ default = {
     },
     "Packages": {
         "selected": "",
-        "download_dir": "script/Presets"
+        "download_dir": "script/Presets",
+        "concurrency": 4
     },
     "Account": {
         "github_name": "Dimitri-Matheus",
@@ -68,10 +77,13 @@ default = {
 }
 
 def grant_user_access(filepath: str):
-    if not os.path.exists(filepath):
+    if not os.path.exists(filepath) or os.name != "nt":
         return
 
     try:
+        # pywin32 is Windows-only, imported here so the config logic stays importable elsewhere
+        import win32security, ntsecuritycon
+
         sd = win32security.GetFileSecurity(filepath, win32security.DACL_SECURITY_INFORMATION)
         dacl = sd.GetSecurityDescriptorDacl()
         if dacl is None:
@@ -86,31 +98,32 @@ def grant_user_access(filepath: str):
         print(f"Failed to set permissions for the file {filepath}: {e}")
 
 
-def update_config(base, template):
-    updated = False
-    new_base = {}
-
+def merge_defaults(config: dict, template: dict = default):
+    """Add the default keys a config is missing, keeping every key the user added (e.g. custom games)."""
     for key, var in template.items():
-        if key not in base:
-            new_base[key] = copy.deepcopy(var)
-            updated = True
-        
-        elif isinstance(var, dict) and isinstance(base[key], dict):
-            sub_dict = base[key] 
-            if update_config(sub_dict, var):
-                updated = True
-            new_base[key] = sub_dict
-            
-        else:
-            new_base[key] = base[key]
-    if list(base.keys()) != list(new_base.keys()):
-        updated = True
+        if key not in config:
+            config[key] = copy.deepcopy(var)
+        elif isinstance(var, dict) and isinstance(config[key], dict):
+            merge_defaults(config[key], var)
+
+
+# Ordered (version, step) pairs, each step upgrades a config from the previous version in place.
+# Bump SCHEMA_VERSION and append a step whenever the defaults or layout change.
+MIGRATIONS = [
+    (1, merge_defaults),
+]
 
-    if updated:
-        base.clear()
-        base.update(new_base)
+def migrate_config(config: dict) -> bool:
+    version = config.get("schema_version", 0)
+    if version >= SCHEMA_VERSION:
+        return False
 
-    return updated
+    for target, step in MIGRATIONS:
+        if version < target:
+            step(config)
+            config["schema_version"] = target
+            logger.info(f"Configuration migrated to schema version {target}")
+    return True
 
 
 def load_config() -> dict:
@@ -119,11 +132,14 @@ def load_config() -> dict:
         return default.copy()
     try:
         with open(config_path, "r", encoding="utf-8") as file:
-            user_config = json.load(file)
-            update = update_config(user_config, default)
-            if update:
-                save_config(user_config)
-            return user_config
+            text = file.read()
+        user_config = json.loads(text)
+        store.written = text
+
+        # Current configs return here without walking the tree
+        if migrate_config(user_config):
+            save_config(user_config)
+        return user_config
         
     except json.JSONDecodeError:
         save_config(default)
@@ -139,13 +155,84 @@ def load_metadata() -> dict:
         return {"presets": []}
 
 
+class ConfigStore:
+    """Debounced writer for settings.json.
+
+    save() serializes on the caller's thread and keeps only the latest text; a timer writes it
+    SAVE_DELAY seconds later, so a burst of UI actions costs one write. Writes whose text matches
+    what is already on disk are skipped.
+    """
+    def __init__(self, path, delay: float = SAVE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.pending = None
+        self.written = None
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def save(self, config: dict):
+        text = json.dumps(config, indent=4, ensure_ascii=False)
+        with self.lock:
+            if text == self.written and self.pending is None:
+                return
+            self.pending = text
+            if self.timer is None:
+                self.timer = threading.Timer(self.delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            text, self.pending = self.pending, None
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            if text is None or text == self.written:
+                return
+            try:
+                self.write(text)
+                self.written = text
+            except Exception as e:
+                logger.error(f"Failed to save the configuration file: {e}")
+
+    def write(self, text: str):
+        created = not self.path.exists()
+        write_atomic(self.path, text, replace=self.replace)
+        if created:
+            grant_user_access(str(self.path))
+
+    def replace(self, temp_path: str, path: Path):
+        if os.name == "nt" and path.exists():
+            import win32file
+
+            # ReplaceFile keeps the ACL granted when the file was created, unlike a plain rename
+            win32file.ReplaceFile(str(path), str(temp_path), None, 0, None, None)
+        else:
+            os.replace(temp_path, path)
+
+    def cancel(self):
+        with self.lock:
+            self.pending = None
+            self.written = None
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+
+store = ConfigStore(config_path)
+atexit.register(store.flush)
+
 def save_config(config: dict):
-    with open(config_path, "w", encoding="utf-8") as file:
-        json.dump(config, file, indent=4, ensure_ascii=False)
-    grant_user_access(str(config_path))
+    store.save(config)
+
+
+def flush_config():
+    store.flush()
 
 
 def delete_config():
+    store.cancel()
     try:
         if config_path.is_file():
             config_path.unlink()
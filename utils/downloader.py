@@ -4,23 +4,28 @@ import os, requests, logging, zipfile, sys, tempfile, subprocess, json
 from requests.exceptions import ConnectTimeout, ReadTimeout, ConnectionError, Timeout, HTTPError
 from pathlib import Path
 from utils.path import resource_path
-from packaging import version
-from win32api import GetFileVersionInfo, LOWORD, HIWORD
+from utils.transfer import get_session, run_pool, stream_to_file, download_resumable, DEFAULT_CONCURRENCY
+from utils.archive import extract_incremental
+from utils.progress import ProgressTracker
+from utils.scheduler import RequestScheduler
+from utils.jobs import DownloadJob, JobCancelled
+from utils.trace import span
+from utils.cache import cached_get, DEFAULT_TTL
+from utils.files import write_atomic
+from utils.manifest import fetch_manifest, build_plan, missing_presets, load_index, save_index, index_entry, sync_plan
 from utils import _env
 # from config import load_config
 
 logger = logging.getLogger(__name__)
 
-def download_file(url, output_path):
-    response = requests.get(url)
-    response.raise_for_status()
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'wb') as f:
-        f.write(response.content)
+def download_file(url, output_path, session=None, expected_size=None, expected_sha=None, progress=None, job=None):
+    stream_to_file(url, output_path, session=session, expected_size=expected_size, expected_sha=expected_sha, progress=progress, job=job)
     logger.info(f"Downloaded {url} → {output_path}")
 
 
 def get_version(size=4):
+    from win32api import GetFileVersionInfo, LOWORD, HIWORD
+
     if "__compiled__" in globals() or getattr(sys, "frozen", False):
         exe = Path(sys.argv[0]).resolve()
         logger.debug(f"Path: {exe}")
@@ -37,36 +42,28 @@ def get_version(size=4):
         return "0.0.0"
 
 
-def sync_metadata(repo_owner, repo_name):
+def sync_metadata(repo_owner, repo_name, cache_ttl=DEFAULT_TTL):
     remote_url = f"https://raw.githubusercontent.com/{repo_owner}/{repo_name}/refs/heads/main/script/Presets/metadata.json"
     local_metadata = resource_path("script/Presets/metadata.json")
 
     try:
-        local_data = {}
-        if os.path.exists(local_metadata):
-            try:
-                with open(local_metadata, "r", encoding="utf-8") as file:
-                    local_data = json.load(file)
-            except Exception:
-                local_data = {}
+        remote_body = cached_get(remote_url, ttl=cache_ttl, timeout=3)
+        json.loads(remote_body)
 
-        response = requests.get(remote_url, timeout=3)
-        response.raise_for_status()
-        remote_data = response.json()
-
-        if local_data == remote_data:
+        if local_metadata.is_file() and local_metadata.read_bytes() == remote_body:
             logger.info("Metadata is already up to date!")
             return
 
-        download_file(remote_url, local_metadata)
+        os.makedirs(local_metadata.parent, exist_ok=True)
+        write_atomic(local_metadata, remote_body)
         logger.info(f"Metadata synchronized successfully!")
     
     except Exception as e:
         logger.warning(f"Sync failed: {e}")
 
 
-def download_from_github(repo_owner, repo_name, resource, selected_preset, download_dir, result_queue, progress_callback=None):
-    progress_callback = progress_callback or (lambda x: None)
+def download_from_github(repo_owner, repo_name, resource, selected_preset, download_dir, result_queue, progress_callback=None, concurrency=DEFAULT_CONCURRENCY, job=None):
+    progress_callback = progress_callback or (lambda *args: None)
 
     validation_items = {
         ConnectionError: "Failed to connect to GitHub!",
@@ -76,53 +73,104 @@ def download_from_github(repo_owner, repo_name, resource, selected_preset, downl
         HTTPError: "GitHub returned an error!",
     }
 
+    job = job or DownloadJob()
+
     try:
         presets = [p for p in selected_preset if p and p.strip()]
         if not download_dir:
             download_dir = resource_path(Path(__file__).parent / resource / "Presets")
         
         download_dir = Path(resource_path(download_dir))
-        resource = resource.rstrip("/\\")
-        total_presets = len(presets)
+        session = get_session(concurrency)
         progress_callback(0.0)
         logger.info("Progress: 0.0%")
 
-        for preset_index, preset_name in enumerate(selected_preset):
-            remote = f"{resource}/Presets/{preset_name}"
-            local = download_dir / preset_name
-            local_remote = [(remote, local)]
-
-            while local_remote:
-                remote_path, local_path = local_remote.pop()
-                api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents/{remote_path}"
-                headers = {'Accept': 'application/vnd.github.v3+json'}
-                logger.info(f"Acessing: {api_url}")
-                response = requests.get(api_url, headers=headers)
-                response.raise_for_status()
-
-                items = response.json()
-                file_count = sum(1 for item in items if item["type"] == "file")
-                for file_index, item in enumerate(items):
-                    if item["type"] == "file":
-                        relative_path = os.path.relpath(item["path"], remote)
-                        output_file = local_path / relative_path
-                        download_file(item["download_url"], str(output_file))
-                        if progress_callback:
-                            progress = ((preset_index + (file_index + 1) / file_count) / total_presets)
-                            progress_callback(progress)
-                            logger.info(f"Progress: {progress * 100:.1f}%")
-                        
-                    elif item["type"] == "dir":
-                        local_remote.append((item["path"], local_path))
-        
-            logger.info(f"Preset '{preset_name}' completed at {local}")
+        scheduler = RequestScheduler(sleep=job.sleep)
+        with span("presets.manifest", "network"):
+            manifest = fetch_manifest(repo_owner, repo_name, resource, session=session, scheduler=scheduler)
+        missing = missing_presets(manifest, presets)
+        for preset in missing:
+            logger.error(f"Preset {preset} was not found in {repo_owner}/{repo_name}")
+
+        # Missing presets keep their local files, the manifest says nothing about them
+        found = [preset for preset in presets if preset not in missing]
+        plan = build_plan(manifest, found, download_dir, repo_owner, repo_name)
+        index = load_index(download_dir)
+        pending = sync_plan(plan, index, found, download_dir, prune=not manifest.get("truncated"))
+        logger.info(f"{len(pending)} of {len(plan)} preset files need to be downloaded")
+
+        tracker = ProgressTracker(progress_callback, job=job)
+        tracker.start_stage("presets", sum(entry["size"] for entry in pending))
+
+        def attempt(entry):
+            sent = 0
+            def progress(size):
+                nonlocal sent
+                sent += size
+                tracker.advance(size)
+            try:
+                download_file(entry["url"], entry["path"], session, entry["size"], entry["sha"], progress, job)
+            except Exception:
+                tracker.advance(-sent)
+                raise
 
-        logger.info("All selected presets have been downloaded successfully!")
-        response =  {
-            "status": True,
-            "message": "Download completed successfully!"
-        }
+        def fetch(entry):
+            try:
+                job.run(scheduler.run, entry["url"], attempt, entry)
+                return {"name": entry["name"], "status": True}
+            except JobCancelled:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to download {entry['name']}: {e}")
+                tracker.shrink(entry["size"])
+                return {"name": entry["name"], "status": False, "error": str(e)}
+
+        def file_done(entry, result):
+            if result["status"]:
+                index["files"][entry["name"]] = index_entry(entry)
+            logger.info(f"Progress: {tracker.fraction() * 100:.1f}%")
+
+        try:
+            with span("presets.download", "network", files=len(pending)):
+                report = run_pool(pending, fetch, concurrency, on_done=file_done)
+        finally:
+            save_index(download_dir, index)
+
+        report += [{"name": preset, "status": False, "error": "Preset not found"} for preset in missing]
+        failed = [result for result in report if not result["status"]]
+        tracker.finish()
+
+        if missing:
+            response = {
+                "status": False,
+                "message": f"Preset not found: {', '.join(missing)}",
+                "files": report
+            }
+        elif failed:
+            logger.error(f"{len(failed)} of {len(pending)} preset files failed to download")
+            response = {
+                "status": False,
+                "message": f"{len(failed)} of {len(pending)} files failed to download!",
+                "files": report
+            }
+        else:
+            logger.info(f"Presets {presets} completed at {download_dir}")
+            logger.info("All selected presets have been downloaded successfully!")
+            response =  {
+                "status": True,
+                "message": "Download completed successfully!",
+                "files": report
+            }
     
+    except JobCancelled:
+        logger.warning("Preset download cancelled!")
+        progress_callback(0.0)
+        response = {
+            "status": False,
+            "cancelled": True,
+            "message": "Download cancelled!"
+        }
+
     except tuple(validation_items.keys()) as e:
         error_type = type(e)
         message = validation_items.get(error_type, str(e))
@@ -147,9 +195,9 @@ def download_from_github(repo_owner, repo_name, resource, selected_preset, downl
     result_queue.put(response)
 
 
-def download_dependencies(directory, progress_callback=None):
+def download_dependencies(directory, progress_callback=None, job=None):
     file_name = "reshade-shaders.zip"
-    progress_callback = progress_callback or (lambda x: None) # Use the given callback or an empty function
+    progress_callback = progress_callback or (lambda *args: None) # Use the given callback or an empty function
 
     validation_items = {
         ConnectionError: "Failed to connect to the server!",
@@ -165,41 +213,41 @@ def download_dependencies(directory, progress_callback=None):
         file_path = download_dir / file_name
         file_path.parent.mkdir(parents=True, exist_ok=True)
         logger.info(f"Connecting to Server...")
-        progress_callback(0.1)
+        tracker = ProgressTracker(progress_callback, job=job)
+        tracker.start_stage("download", 0, 0.75)
 
         logger.info(f"Downloading {file_name}...")
-        response = requests.get(_env.BASE_URL, stream=True, headers={"User-Agent": _env.USER_AGENT}, timeout=30)
-        response.raise_for_status()
-
-        total_size = int(response.headers.get("content-length", 0))
-        download = 0
-
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    download += len(chunk)
-
-                    if total_size > 0:
-                        progress = 0.1 + (download / total_size) * 0.6
-                        progress_callback(progress)
-        
-        progress_callback(0.7)
-
-        with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall(download_dir)
+        with span("dependencies.download", "network"):
+            download_resumable(
+                _env.BASE_URL, file_path,
+                headers={"User-Agent": _env.USER_AGENT},
+                progress_callback=tracker.update,
+                job=job
+            )
+
+        tracker.start_stage("extract", 0, 0.25)
+        with span("dependencies.extract"):
+            extract_incremental(file_path, download_dir, progress_callback=tracker.update, job=job)
         logger.info(f"Extracted files to the folder {download_dir}/")
-        progress_callback(0.9)
 
         file_path.unlink()
         logger.info(f"Deleted {file_name}")
-        progress_callback(1.0)
+        tracker.finish()
 
         logger.info("All dependencies have been downloaded successfully!")
         return {
             "status": True
         }
 
+    except JobCancelled:
+        logger.warning("Dependency download cancelled!")
+        progress_callback(0.0)
+        return {
+            "status": False,
+            "cancelled": True,
+            "message": "Download cancelled!"
+        }
+
     except tuple(validation_items.keys()) as e:
         error_type = type(e)
         message = validation_items.get(error_type, str(e))
@@ -225,7 +273,9 @@ def download_dependencies(directory, progress_callback=None):
         }
 
 
-def check_for_updates(github_owner, enabled_auto_check_update):
+def check_for_updates(github_owner, enabled_auto_check_update, cache_ttl=DEFAULT_TTL):
+    from packaging import version
+
     current_version = get_version(size=3)
     remote_url = f"https://api.github.com/repos/{github_owner}/StarLuxe/releases/latest"
 
@@ -236,9 +286,7 @@ def check_for_updates(github_owner, enabled_auto_check_update):
         }
 
     try:
-        response = requests.get(remote_url)
-        response.raise_for_status()
-        body = response.json()
+        body = json.loads(cached_get(remote_url, ttl=cache_ttl, headers={'Accept': 'application/vnd.github.v3+json'}, timeout=5))
         latest_version = None
 
         version_str = body["tag_name"].strip()
@@ -281,11 +329,7 @@ def download_update(url):
     installer_path = os.path.join(temp_dir, "StarLuxe_Update.exe")
 
     try:
-        r = requests.get(url, stream=True)
-        with open(installer_path, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        download_resumable(url, installer_path)
 
         logger.info("Update downloaded successfully!")
         subprocess.Popen([installer_path, "/SILENT", "/SP-", "/SUPPRESSMSGBOXES", "/NORESTART"])
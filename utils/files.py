@@ -0,0 +1,32 @@
+"""Utils for all related to writing files atomically"""
+
+import os, tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+@contextmanager
+def atomic_open(path, mode: str = "w", fsync: bool = True, replace=os.replace):
+    """Open a temporary file next to path that replaces it once the block finishes without error.
+
+    If the block raises, the temporary file is removed and path is left untouched. fsync=False skips
+    flushing to disk for files that can be rebuilt, such as extracted archives or thumbnails, and
+    `replace(temp_path, path)` performs the final swap.
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, mode, encoding=None if "b" in mode else "utf-8") as file:
+            yield file
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(path, data: str | bytes, fsync: bool = True, replace=os.replace):
+    """Replace path with data (text is written as UTF-8) without ever leaving it half written."""
+    with atomic_open(path, "wb" if isinstance(data, bytes) else "w", fsync, replace) as file:
+        file.write(data)
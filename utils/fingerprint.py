@@ -0,0 +1,100 @@
+"""Utils for all related to hashing files once and remembering the digest between runs"""
+
+import os, json, zlib, atexit, hashlib, logging, threading
+from pathlib import Path
+from utils.path import resource_path
+from utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+digest_path = resource_path("cache/digests.json")
+CHUNK_SIZE = 1024 * 1024
+
+def file_fingerprint(path: Path) -> list:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def compute_digest(path: Path, algorithm: str) -> str:
+    with open(path, "rb", buffering=CHUNK_SIZE) as file:
+        if algorithm == "sha256":
+            return hashlib.file_digest(file, "sha256").hexdigest()
+
+        if algorithm == "git":
+            # Same name git gives the blob, comparable with the SHAs of a tree listing
+            header = f"blob {os.fstat(file.fileno()).st_size}\0".encode()
+            return hashlib.file_digest(file, lambda: hashlib.sha1(header)).hexdigest()
+
+        if algorithm == "crc32":
+            crc = 0
+            while chunk := file.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+            return f"{crc:08x}"
+
+    raise ValueError(f"Unknown digest algorithm: {algorithm}")
+
+
+class DigestCache:
+    """Digests keyed by (path, size, mtime_ns, inode), persisted to cache/digests.json.
+
+    A file is only read again when one of those changes. New digests are kept in memory and saved
+    by save(), which callers run after a batch and which also runs at exit. Only the entries looked
+    up during this run are saved, so digests of deleted or moved files do not pile up.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = None
+        self.used = set()
+        self.stored = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+        self.stored = len(self.entries)
+
+    def digest(self, path, algorithm: str = "sha256") -> str:
+        path = Path(path).resolve()
+        fingerprint = file_fingerprint(path)
+        key = f"{algorithm}:{path}"
+
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            self.used.add(key)
+            record = self.entries.get(key)
+            if record and record["fingerprint"] == fingerprint:
+                return record["digest"]
+
+        digest = compute_digest(path, algorithm)
+        with self.lock:
+            self.entries[key] = {"fingerprint": fingerprint, "digest": digest}
+            self.dirty = True
+        return digest
+
+    def save(self):
+        with self.lock:
+            if self.entries is None:
+                return
+            entries = {key: self.entries[key] for key in self.used if key in self.entries}
+            if not self.dirty and len(entries) == self.stored:
+                return
+            self.dirty = False
+            self.stored = len(entries)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.path, json.dumps(entries))
+        except OSError as e:
+            logger.warning(f"Could not save the digest cache: {e}")
+
+
+digest_cache = DigestCache(digest_path)
+atexit.register(digest_cache.save)
+
+def file_digest(path, algorithm: str = "sha256") -> str:
+    return digest_cache.digest(path, algorithm)
@@ -0,0 +1,149 @@
+"""Utils for all related to decoding and caching images shared by the GUI"""
+
+import os, json, hashlib, logging, threading
+from collections import OrderedDict
+from pathlib import Path
+import PIL.Image
+import customtkinter as ctk
+from utils.path import resource_path
+from utils.trace import span
+from utils.files import atomic_open, write_atomic
+
+logger = logging.getLogger(__name__)
+
+MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Thumbnails are kept next to the sources, only for folders that ship with the launcher
+thumb_roots = (resource_path("assets/icon"), resource_path("assets/games"), resource_path("themes"))
+thumb_dir = ".thumbs"
+thumb_index = "index.json"
+# Rendered at twice the display size so CTkImage still has pixels to spare on HiDPI scaling
+THUMB_SCALE = 2
+
+def source_sha(path: Path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha1").hexdigest()
+
+
+def load_thumb_index(folder: Path) -> dict:
+    try:
+        with open(folder / thumb_index, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_thumb_index(folder: Path, index: dict):
+    write_atomic(folder / thumb_index, json.dumps(index, indent=4))
+
+
+def is_thumbnailable(path: Path) -> bool:
+    return any(path.is_relative_to(root) for root in thumb_roots)
+
+
+def get_thumbnail(path: Path, size: tuple[int, int]) -> Path:
+    """Return a pre-resized RGBA copy of path for the given display size, or path itself.
+
+    The source hash is only recomputed when its size or mtime changes; a new hash replaces every
+    thumbnail of the old one. Sources that already fit the display size are used as they are.
+    """
+    if not is_thumbnailable(path):
+        return path
+
+    width, height = size
+    try:
+        # Only the header is read here
+        with PIL.Image.open(path) as source:
+            if source.width <= width * THUMB_SCALE and source.height <= height * THUMB_SCALE:
+                return path
+    except OSError:
+        return path
+
+    folder = path.parent / thumb_dir
+    index = load_thumb_index(folder)
+    stat = path.stat()
+    record = index.get(path.name)
+
+    if not record or record["size"] != stat.st_size or record["mtime_ns"] != stat.st_mtime_ns:
+        sha = source_sha(path)
+        if record and record["sha"] != sha:
+            for stale in folder.glob(f"{path.name}.*.{record['sha'][:12]}.png"):
+                stale.unlink(missing_ok=True)
+        record = index[path.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha": sha}
+        changed = True
+    else:
+        changed = False
+
+    thumb_path = folder / f"{path.name}.{width}x{height}.{record['sha'][:12]}.png"
+
+    try:
+        if not thumb_path.is_file():
+            folder.mkdir(exist_ok=True)
+            with span("image.thumbnail", "image", path=path.name):
+                with PIL.Image.open(path) as source:
+                    thumb = source.convert("RGBA")
+                thumb.thumbnail((width * THUMB_SCALE, height * THUMB_SCALE), PIL.Image.LANCZOS)
+                with atomic_open(thumb_path, "wb", fsync=False) as file:
+                    thumb.save(file, format="PNG")
+            logger.debug(f"Thumbnail created: {thumb_path.name}")
+        if changed:
+            save_thumb_index(folder, index)
+    except OSError as e:
+        logger.warning(f"Thumbnail cache unavailable for {path.name}: {e}")
+        return path
+
+    return thumb_path
+
+
+class ImageCache:
+    """Process-wide LRU of decoded images keyed by (path, mtime, file size, display size).
+
+    Sources under the launcher's own folders are decoded from their on-disk thumbnail, so the
+    budget, which counts decoded pixel bytes, mostly holds small images.
+    """
+    def __init__(self, budget: int = MEMORY_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, path, size: tuple[int, int]) -> ctk.CTkImage:
+        path = Path(os.path.abspath(path))
+        size = tuple(size)
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size, size)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry["image"]
+
+        source = get_thumbnail(path, size)
+        with span("image.decode", "image", path=source.name):
+            decoded = PIL.Image.open(source)
+            decoded.load()
+
+        cost = decoded.width * decoded.height * len(decoded.getbands())
+        image = ctk.CTkImage(decoded, size=size)
+
+        with self.lock:
+            self.entries[key] = {"image": image, "cost": cost}
+            self.used += cost
+            while self.used > self.budget and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.used -= evicted["cost"]
+                logger.debug(f"Image cache evicted an entry, {self.used / 1_000_000:.1f} MB in use")
+
+        return image
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.used = 0
+
+
+image_cache = ImageCache()
+
+def load_image(path, size: tuple[int, int]) -> ctk.CTkImage:
+    return image_cache.get(path, size)
@@ -0,0 +1,114 @@
+"""Utils for all related to reading and patching INI files without rewriting their layout"""
+
+import logging
+from pathlib import Path
+from utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+def split_lines(data: bytes) -> list[bytes]:
+    return data.splitlines(keepends=True)
+
+
+def section_name(line: bytes) -> str | None:
+    stripped = line.strip()
+    if stripped.startswith(b"[") and stripped.endswith(b"]"):
+        return stripped[1:-1].strip().decode("utf-8", "surrogateescape")
+    return None
+
+
+def parse_key(line: bytes) -> tuple[str, int] | None:
+    """Return (key, offset of '=') for a `key=value` line, None for comments and blanks."""
+    stripped = line.lstrip()
+    if not stripped or stripped[:1] in (b";", b"#") or b"=" not in line:
+        return None
+    offset = line.index(b"=")
+    return line[:offset].strip().decode("utf-8", "surrogateescape"), offset
+
+
+def read_ini(path: Path, section: str, keys: list) -> dict:
+    """Values of keys in one section, stripped like configparser does; missing keys map to ""."""
+    values = {key: "" for key in keys}
+    current = None
+    with open(path, "rb") as file:
+        for line in file:
+            name = section_name(line)
+            if name is not None:
+                current = name
+                continue
+            if current != section:
+                continue
+            parsed = parse_key(line)
+            if parsed and parsed[0] in values:
+                values[parsed[0]] = line[parsed[1] + 1:].strip().decode("utf-8", "surrogateescape")
+    return values
+
+
+def patch_ini(path: Path, section: str, values: dict) -> bool:
+    """Set keys in one section, leaving every other byte of the file as it was.
+
+    Changed keys keep their spacing and line ending, missing keys are appended to the section and
+    a missing section to the file. Nothing is written when the values already match.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    lines = split_lines(data)
+    newline = b"\r\n" if b"\r\n" in data else b"\n"
+    encoded = {key: str(value).encode("utf-8", "surrogateescape") for key, value in values.items()}
+
+    pending = dict(encoded)
+    changed = False
+    current = None
+    section_end = None
+
+    for index, line in enumerate(lines):
+        name = section_name(line)
+        if name is not None:
+            if current == section:
+                section_end = index
+            current = name
+            continue
+        if current != section:
+            continue
+
+        parsed = parse_key(line)
+        if not parsed or parsed[0] not in pending:
+            continue
+
+        key, offset = parsed
+        value = pending.pop(key)
+        body = line.rstrip(b"\r\n")
+        ending = line[len(body):]
+        old_value = body[offset + 1:]
+        if old_value.strip() == value:
+            continue
+
+        padding = old_value[:len(old_value) - len(old_value.lstrip())]
+        lines[index] = body[:offset + 1] + padding + value + ending
+        changed = True
+
+    if pending:
+        added = [f"{key}=".encode("utf-8", "surrogateescape") + value + newline for key, value in pending.items()]
+        if current == section and section_end is None:
+            section_end = len(lines)
+        if section_end is None:
+            # Separate the new section from the last one by a blank line, as the file does
+            if lines and not lines[-1].endswith((b"\n", b"\r")):
+                lines[-1] += newline
+            header = [newline] if lines and lines[-1].strip() else []
+            lines += header + [f"[{section}]".encode("utf-8") + newline] + added
+        else:
+            # Insert after the last non-blank line of the section
+            while section_end > 0 and not lines[section_end - 1].strip():
+                section_end -= 1
+            if section_end > 0 and not lines[section_end - 1].endswith((b"\n", b"\r")):
+                lines[section_end - 1] += newline
+            lines[section_end:section_end] = added
+        changed = True
+
+    if not changed:
+        return False
+
+    write_atomic(path, b"".join(lines))
+    logger.info(f"Patched {', '.join(values)} in {path.name}")
+    return True
@@ -1,26 +1,24 @@
 """Utils for all related to Reshade injection logic"""
 
-import psutil, shutil, subprocess, logging, json, hashlib, time, configparser, os
+import shutil, logging, json, os
 from pathlib import Path
-from pymem import Pymem
-from pymem.process import inject_dll_from_path
 from utils.path import relative_path
+from utils.trace import span
+from utils.jobs import JobCancelled
+from utils.process import ProcessBackend, PymemBackend
+from utils.fingerprint import file_digest
+from utils.mounts import mount_index, UNKNOWN
+from utils.ini import read_ini, patch_ini
 # from config import load_config
 
 logger = logging.getLogger(__name__)
 
 def get_filesystem(path: str) -> str:
     try:
-        drive_path = Path(path).resolve().drive
-        if not drive_path:
-            return "Filesystem Unknown"
-
-        for partition in psutil.disk_partitions():
-            if partition.device.startswith(drive_path):
-                return partition.fstype.upper()
-        
+        return mount_index.filesystem(Path(path).resolve())
     except Exception as e:
         logger.warning(f"Error detecting filesystem type: {e}")
+        return UNKNOWN
 
 
 class ReshadeSetup():
@@ -114,7 +112,9 @@ class ReshadeSetup():
             "status": True
         }
 
-    def inject_game(self, timeout: int = 30):
+    def inject_game(self, timeout: int = 30, job=None, backend: ProcessBackend = None):
+        backend = backend or PymemBackend()
+
         if not all([hasattr(self, 'game_dir'), hasattr(self, 'exe_path')]):
             raise RuntimeError("Installation check must complete successfully before injection")
         
@@ -124,11 +124,8 @@ class ReshadeSetup():
             shutil.copy2(str(self.reshade_src), str(ini_dest))
 
         try:
-            ini_file = configparser.ConfigParser()
-            ini_file.optionxform = str
-            ini_file.read(ini_dest)
-
-            if get_filesystem(str(self.game_dir)) == "NTFS":
+            filesystem = get_filesystem(str(self.game_dir))
+            if filesystem == "NTFS":
                 link_shader = self.game_dir / self.shaders_src.name
                 if not link_shader.exists():
                     link_shader.symlink_to(self.shaders_src, target_is_directory=True)
@@ -140,27 +137,20 @@ class ReshadeSetup():
                     logger.info(f"Creating symbolic link: {link_preset} -> {self.download_src}")
 
             required_keys = ["EffectSearchPaths", "TextureSearchPaths", "PresetPath"]
-            path_flag = False
-            
-            for key in required_keys:
-                value = ini_file.get("GENERAL", key, fallback="")
-                if value.startswith("."):
-                    path_flag = True
-                    break
+            values = read_ini(ini_dest, "GENERAL", required_keys)
+            path_flag = any(value.startswith(".") for value in values.values())
 
-            if get_filesystem(str(self.game_dir)) != "NTFS" and path_flag:
+            if filesystem != "NTFS" and path_flag:
                 shaders = self.shaders_src / "Shaders"
                 textures = self.shaders_src / "Textures"
                 presets = self.download_src / "ReShadePreset.ini"
 
-                ini_file.set("GENERAL", "EffectSearchPaths", str(shaders.resolve()))
-                ini_file.set("GENERAL", "TextureSearchPaths", str(textures.resolve()))
-                ini_file.set("GENERAL", "PresetPath", str(presets.resolve()))
-
-                with open(ini_dest, "w") as file:
-                    ini_file.write(file)
-
-                logger.info("ReShade.ini configured successfully with absolute paths!")
+                if patch_ini(ini_dest, "GENERAL", {
+                    "EffectSearchPaths": str(shaders.resolve()),
+                    "TextureSearchPaths": str(textures.resolve()),
+                    "PresetPath": str(presets.resolve())
+                }):
+                    logger.info("ReShade.ini configured successfully with absolute paths!")
 
         except Exception as e:
             logger.error(f"ReShade.ini configuration failed: {e}")
@@ -179,30 +169,23 @@ class ReshadeSetup():
             reshade_env = os.environ.copy()
             reshade_env["RESHADE_DISABLE_LOADING_CHECK"] = "1"
 
-            subprocess.Popen(args, cwd=str(self.game_dir), env=reshade_env)
-            logger.info(f"Waiting for {self.exe_path.name} to start...")
+            pid = backend.spawn(args, cwd=str(self.game_dir), env=reshade_env)
+            logger.info(f"Waiting for {self.exe_path.name} to start (pid {pid})...")
 
-            start = time.time()
-            process_name = None
+            with span("inject.wait_process", "launch"):
+                target = backend.wait_for_target(pid, self.exe_path.name, timeout, job)
 
-            while time.time() - start < timeout:
-                try:
-                    process_name = Pymem(self.exe_path.name)
-                    break
-                except:
-                    time.sleep(0.5)
-
-            if process_name:
-                if self.direct_enabled:
-                    inject_dll_from_path(process_name.process_handle, str(self.reshade_dxvk))
-                    logger.info(f"{self.reshade_dxvk.name} injected successfully!")
-                else:
-                    inject_dll_from_path(process_name.process_handle, str(self.reshade_dll))
-                    logger.info(f"{self.reshade_dll.name} injected successfully!")
+            if target is not None:
+                dll = self.reshade_dxvk if self.direct_enabled else self.reshade_dll
+                with span("inject.dll", "launch", pid=target):
+                    backend.inject(target, str(dll))
+                logger.info(f"{dll.name} injected successfully!")
                 return {"message": None}
             else:
                 raise RuntimeError(f"Game process {self.exe_path.name} did not start within {timeout} seconds...")
 
+        except JobCancelled:
+            raise
         except Exception as e:
             logger.error(f"Injection process failed: {e}")
             return {
@@ -260,17 +243,9 @@ class ReshadeSetup():
 
     # Define Hash files
     def _sha256(self, file_source: Path, file_destination: Path) -> bool:
-        source_hash = hashlib.sha256()
-        with open(file_source, "rb") as file_1:
-            while chunk := file_1.read(4096):
-                source_hash.update(chunk)
-
-        destination_hash = hashlib.sha256()
-        with open(file_destination, "rb") as file_2:
-            while chunk := file_2.read(4096):
-                destination_hash.update(chunk)
-
-        return source_hash.hexdigest() != destination_hash.hexdigest()
+        if not Path(file_destination).is_file():
+            return True
+        return file_digest(file_source) != file_digest(file_destination)
     
     def dxvk_support(self):
         if self.direct_enabled and not self.reshade_dxvk.is_file():
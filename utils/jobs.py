@@ -0,0 +1,65 @@
+"""Utils for all related to cancelling, pausing and resuming background jobs"""
+
+import threading
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobPaused(Exception):
+    pass
+
+
+class DownloadJob:
+    """Shared cancel/pause state polled by the transfer loops between chunks."""
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.running = threading.Event()
+        self.running.set()
+        self.resumes = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self.running.is_set()
+
+    def cancel(self):
+        self.cancelled.set()
+        self.running.set()
+
+    def pause(self):
+        if not self.is_cancelled:
+            self.running.clear()
+
+    def resume(self):
+        if self.is_paused:
+            self.resumes += 1
+        self.running.set()
+
+    def checkpoint(self):
+        """Raise inside a transfer so it can drop its connection while cancelled or paused."""
+        if self.is_cancelled:
+            raise JobCancelled()
+        if self.is_paused:
+            raise JobPaused()
+
+    def wait_if_paused(self):
+        self.running.wait()
+        if self.is_cancelled:
+            raise JobCancelled()
+
+    def sleep(self, seconds: float):
+        if self.cancelled.wait(seconds):
+            raise JobCancelled()
+
+    def run(self, func, *args, **kwargs):
+        """Call func until it finishes, waiting for resume whenever it stops with JobPaused."""
+        while True:
+            self.wait_if_paused()
+            try:
+                return func(*args, **kwargs)
+            except JobPaused:
+                continue
@@ -0,0 +1,69 @@
+"""Utils for all related to running the game launch stages off the UI thread"""
+
+import time, queue, logging, threading
+from utils.jobs import DownloadJob, JobCancelled
+from utils.trace import span
+
+logger = logging.getLogger(__name__)
+
+class LaunchPipeline:
+    """Run (name, label, func) stages in order on a worker thread and stream their status to Tk.
+
+    Events are posted on a queue that the Tk side drains with after(), like StartupTasks. A stage
+    stops the pipeline by returning {"status": False} or a non-empty "message"; cancelling is
+    checked between stages and by any stage that waits on the job.
+    """
+    def __init__(self, stages: list[tuple], interval: int = 100):
+        self.stages = stages
+        self.interval = interval
+        self.job = DownloadJob()
+        self.events = queue.Queue()
+
+    def cancel(self):
+        self.job.cancel()
+
+    def run(self):
+        result = {"status": True, "message": None}
+        try:
+            with span("launch", "launch"):
+                for index, (name, label, func) in enumerate(self.stages, start=1):
+                    if self.job.is_cancelled:
+                        raise JobCancelled()
+                    self.events.put(("stage", {"name": name, "label": label, "index": index, "total": len(self.stages)}))
+
+                    start = time.perf_counter()
+                    with span(f"launch.{name}", "launch"):
+                        outcome = func()
+                    logger.info(f"Launch stage {name} finished in {time.perf_counter() - start:.2f}s")
+
+                    if isinstance(outcome, dict) and (outcome.get("status") is False or outcome.get("message")):
+                        result = {"status": False, "message": outcome.get("message")}
+                        break
+
+        except JobCancelled:
+            logger.info("Launch cancelled")
+            result = {"status": False, "message": None, "cancelled": True}
+        except Exception as e:
+            logger.error(f"Launch failed: {e}")
+            result = {"status": False, "message": str(e)}
+
+        self.events.put(("done", result))
+
+    def start(self, widget, on_stage, on_done):
+        """Start the worker and call on_stage(stage) / on_done(result) on the Tk thread."""
+        threading.Thread(target=self.run, name="launch", daemon=True).start()
+
+        def poll():
+            while True:
+                try:
+                    kind, payload = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "stage":
+                    on_stage(payload)
+                else:
+                    on_done(payload)
+                    return
+            widget.after(self.interval, poll)
+
+        widget.after(self.interval, poll)
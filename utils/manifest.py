@@ -0,0 +1,184 @@
+"""Utils for all related to the remote preset manifest"""
+
+import json, logging, os
+from pathlib import Path
+from urllib.parse import quote
+from requests.exceptions import RequestException
+from utils.path import resource_path
+from utils.transfer import get_session
+from utils.scheduler import RequestScheduler
+from utils.fingerprint import file_digest
+from utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+manifest_path = resource_path("cache/manifest.json")
+index_name = ".index.json"
+DEFAULT_BRANCH = "main"
+
+def load_manifest() -> dict:
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest: dict):
+    os.makedirs(manifest_path.parent, exist_ok=True)
+    write_atomic(manifest_path, json.dumps(manifest, indent=4, ensure_ascii=False))
+
+
+def fetch_manifest(repo_owner, repo_name, resource, branch=DEFAULT_BRANCH, session=None, scheduler=None) -> dict:
+    """Fetch every preset file below {resource}/Presets with a single recursive git tree request.
+
+    The tree is cached together with its ETag, so an unchanged repository answers with 304 and
+    the cached manifest is reused. With a cached manifest the request skips rate-limit pauses and
+    any failure falls back to the cache.
+    """
+    session = session or get_session()
+    scheduler = scheduler or RequestScheduler()
+    resource = resource.rstrip("/\\")
+    prefix = f"{resource}/Presets/"
+    source = f"{repo_owner}/{repo_name}@{branch}"
+
+    cached = load_manifest()
+    if cached.get("source") != source or cached.get("prefix") != prefix:
+        cached = {}
+
+    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/git/trees/{quote(branch)}?recursive=1"
+    headers = {'Accept': 'application/vnd.github.v3+json'}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    def get_tree():
+        response = session.get(api_url, headers=headers, timeout=30)
+        response.raise_for_status()
+        return response
+
+    try:
+        logger.info(f"Acessing: {api_url}")
+        response = scheduler.run(api_url, get_tree, cached=bool(cached))
+        if response.status_code == 304 and cached:
+            logger.info("Preset manifest is already up to date!")
+            return cached
+
+    except RequestException as e:
+        if cached:
+            logger.warning(f"Using cached preset manifest: {e}")
+            return cached
+        raise
+
+    body = response.json()
+    truncated = bool(body.get("truncated"))
+    if truncated:
+        logger.warning("GitHub truncated the repository tree, some presets may be missing!")
+
+    files = {
+        item["path"][len(prefix):]: {"sha": item["sha"], "size": item.get("size", 0)}
+        for item in body.get("tree", [])
+        if item["type"] == "blob" and item["path"].startswith(prefix)
+    }
+
+    manifest = {
+        "source": source,
+        "prefix": prefix,
+        "etag": response.headers.get("ETag", ""),
+        "tree": body.get("sha", ""),
+        "files": files,
+        "truncated": truncated,
+    }
+    save_manifest(manifest)
+    logger.info(f"Preset manifest updated: {len(files)} files")
+    return manifest
+
+
+def build_plan(manifest: dict, presets: list, download_dir: Path, repo_owner, repo_name, branch=DEFAULT_BRANCH) -> list[dict]:
+    """Return one download entry per manifest file that belongs to a selected preset."""
+    raw_root = f"https://raw.githubusercontent.com/{repo_owner}/{repo_name}/{quote(branch)}/"
+    plan = []
+
+    for name, item in manifest.get("files", {}).items():
+        preset_name = name.split("/", 1)[0]
+        if preset_name not in presets:
+            continue
+
+        plan.append({
+            "name": name,
+            "preset": preset_name,
+            "url": raw_root + quote(manifest["prefix"] + name),
+            "path": Path(download_dir) / name,
+            "sha": item["sha"],
+            "size": item["size"],
+        })
+
+    return plan
+
+
+def missing_presets(manifest: dict, presets: list) -> list:
+    """Selected presets without any file in the manifest, e.g. a typo or a stale cached manifest."""
+    available = {name.split("/", 1)[0] for name in manifest.get("files", {})}
+    return [preset for preset in presets if preset not in available]
+
+
+def git_blob_sha(path: Path) -> str:
+    """Hash a local file the same way git names blobs, so it can be compared with the tree SHA."""
+    return file_digest(path, "git")
+
+
+def load_index(download_dir: Path) -> dict:
+    try:
+        with open(Path(download_dir) / index_name, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"files": {}}
+
+
+def save_index(download_dir: Path, index: dict):
+    index_path = Path(download_dir) / index_name
+    os.makedirs(index_path.parent, exist_ok=True)
+    write_atomic(index_path, json.dumps(index, indent=4, ensure_ascii=False))
+
+
+def index_entry(entry: dict) -> dict:
+    stat = os.stat(entry["path"])
+    return {"sha": entry["sha"], "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def is_current(entry: dict, index: dict) -> bool:
+    """Check a plan entry against the local index, hashing only files the index does not know yet."""
+    path = Path(entry["path"])
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+
+    known = index["files"].get(entry["name"])
+    if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+        return known["sha"] == entry["sha"]
+
+    if stat.st_size != entry["size"] or git_blob_sha(path) != entry["sha"]:
+        return False
+
+    index["files"][entry["name"]] = index_entry(entry)
+    return True
+
+
+def sync_plan(plan: list[dict], index: dict, presets: list, download_dir: Path, prune: bool = True) -> list[dict]:
+    """Return the entries that must be transferred and prune tracked files deleted remotely.
+
+    Pass prune=False when the manifest is incomplete, as missing files are not known to be deleted.
+    """
+    if prune:
+        planned = {entry["name"] for entry in plan}
+        for name in list(index["files"]):
+            if name.split("/", 1)[0] in presets and name not in planned:
+                stale = Path(download_dir) / name
+                if stale.is_file():
+                    stale.unlink()
+                    logger.info(f"Pruned {stale}")
+                index["files"].pop(name)
+    else:
+        logger.warning("Preset manifest is incomplete, skipping pruning")
+
+    return [entry for entry in plan if not is_current(entry, index)]
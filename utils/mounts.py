@@ -0,0 +1,86 @@
+"""Utils for all related to resolving which filesystem a path lives on"""
+
+import os, re, logging, threading
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN = "Filesystem Unknown"
+
+def psutil_partitions() -> list[tuple[str, str]]:
+    import psutil
+    return [(partition.mountpoint, partition.fstype) for partition in psutil.disk_partitions()]
+
+
+def mount_signature():
+    """Cheap token that changes whenever drives or mounts are added or removed."""
+    if hasattr(os, "listdrives"):
+        return tuple(os.listdrives())
+    if os.name == "nt":
+        import ctypes
+
+        # Python < 3.12 has no os.listdrives, the bitmask of drive letters changes the same way
+        return ctypes.windll.kernel32.GetLogicalDrives()
+    try:
+        with open("/proc/self/mounts", "r", encoding="utf-8") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def normalize(path) -> str:
+    """Fold Windows and POSIX spellings into one key, e.g. 'C:/Games/' -> 'c:/games' and '/mnt/' -> '/mnt'."""
+    path = str(path).replace("\\", "/")
+    if re.match(r"^[A-Za-z]:", path):
+        path = path.lower()
+    return path.rstrip("/") or "/"
+
+
+def prefixes(key: str):
+    """Yield key and each of its parents, deepest first."""
+    while True:
+        yield key
+        if key == "/" or "/" not in key:
+            return
+        parent = key.rsplit("/", 1)[0]
+        key = parent or "/"
+
+
+class MountIndex:
+    """Longest-prefix index of mount points, rebuilt only when the mount signature changes.
+
+    `provider` returns (mountpoint, fstype) pairs and `signature` a cheap change token; both can
+    be replaced with synthetic tables to exercise Windows and Linux layouts anywhere.
+    """
+    def __init__(self, provider=psutil_partitions, signature=mount_signature):
+        self.provider = provider
+        self.signature = signature
+        self.token = object()
+        self.mounts = {}
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        token = self.signature()
+        if token is not None and token == self.token:
+            return
+
+        partitions = tuple(sorted(self.provider()))
+        mounts = {normalize(mountpoint): fstype.upper() for mountpoint, fstype in partitions if fstype}
+        if mounts != self.mounts:
+            logger.debug(f"Mount index rebuilt with {len(mounts)} mount points")
+        self.mounts = mounts
+        self.token = token
+
+    def filesystem(self, path) -> str:
+        """Filesystem of an absolute path, in O(path depth) once the index is built."""
+        with self.lock:
+            self.refresh()
+            mounts = self.mounts
+
+        for key in prefixes(normalize(path)):
+            fstype = mounts.get(key)
+            if fstype:
+                return fstype
+        return UNKNOWN
+
+
+mount_index = MountIndex()
@@ -0,0 +1,141 @@
+"""Utils for all related to starting the game process and attaching to it for injection"""
+
+import os, time, logging, subprocess
+from abc import ABC, abstractmethod
+from utils.jobs import JobCancelled
+
+logger = logging.getLogger(__name__)
+
+class ProcessBackend(ABC):
+    """Spawn a game, find the process that actually runs it and inject a DLL into it.
+
+    wait_for_target() checks the spawned PID first, so a direct launch attaches without waiting;
+    only launcher stubs that hand off to a child process are re-checked, after each pause().
+    """
+    interval = 0.05
+
+    @abstractmethod
+    def spawn(self, args: list, cwd: str, env: dict) -> int:
+        ...
+
+    @abstractmethod
+    def find_target(self, pid: int, exe_name: str) -> int | None:
+        ...
+
+    @abstractmethod
+    def inject(self, pid: int, dll_path: str):
+        ...
+
+    def wait_for_target(self, pid: int, exe_name: str, timeout: float, job=None) -> int | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            target = self.find_target(pid, exe_name)
+            if target is not None or time.monotonic() >= deadline:
+                return target
+            self.pause(pid, self.interval, job)
+
+    def pause(self, pid: int, seconds: float, job=None):
+        if job:
+            job.sleep(seconds)
+        else:
+            time.sleep(seconds)
+
+
+class PymemBackend(ProcessBackend):
+    # A full process scan is costly, stubs are re-scanned at most this often unless they exit first
+    interval = 0.5
+
+    def __init__(self):
+        self.started = {}
+        self.trees = {}
+
+    def spawn(self, args: list, cwd: str, env: dict) -> int:
+        process = subprocess.Popen(args, cwd=cwd, env=env)
+        self.started[process.pid] = (process, time.time())
+        self.trees[process.pid] = {process.pid}
+        return process.pid
+
+    def find_target(self, pid: int, exe_name: str) -> int | None:
+        import psutil
+
+        exe_name = exe_name.lower()
+        process, started = self.started.get(pid, (None, 0))
+        tree = self.trees.setdefault(pid, {pid})
+
+        try:
+            if (process is None or process.poll() is None) and psutil.Process(pid).name().lower() == exe_name:
+                return pid
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as e:
+            logger.warning(f"Cannot inspect process {pid}: {e}")
+
+        # Grow the spawned process tree by parent PID, oldest first so grandchildren follow their parents.
+        # Orphans keep their parent PID on Windows and the tree is remembered between polls, so a stub
+        # that already exited still leads to its game, never to an instance that was running before
+        processes = sorted(psutil.process_iter(["pid", "ppid", "name", "create_time"]), key=lambda candidate: candidate.info["create_time"] or 0)
+        for candidate in processes:
+            info = candidate.info
+            if info["ppid"] in tree and (info["create_time"] or 0) >= started - 1:
+                tree.add(info["pid"])
+
+        for candidate in processes:
+            info = candidate.info
+            if info["pid"] != pid and info["pid"] in tree and (info["name"] or "").lower() == exe_name:
+                return info["pid"]
+        return None
+
+    def pause(self, pid: int, seconds: float, job=None):
+        """Wait for the next scan, waking up as soon as a running stub exits after its hand-off."""
+        process, _ = self.started.get(pid, (None, 0))
+        if process is None or process.poll() is not None:
+            return super().pause(pid, seconds, job)
+        try:
+            process.wait(seconds)
+        except subprocess.TimeoutExpired:
+            pass
+        if job and job.is_cancelled:
+            raise JobCancelled()
+
+    def inject(self, pid: int, dll_path: str):
+        # pymem is only needed once a game is launched, keep it out of the startup imports
+        from pymem import Pymem
+        from pymem.process import inject_dll_from_path
+
+        process = Pymem()
+        process.open_process_from_id(pid)
+        try:
+            inject_dll_from_path(process.process_handle, str(dll_path))
+        finally:
+            process.close_process()
+
+
+class FakeBackend(ProcessBackend):
+    """In-memory backend for running the launch flow without Windows or a game.
+
+    `ready_after` is how many find_target() calls return None before the target appears, and
+    `child_pid` simulates a launcher stub whose game runs as a child process.
+    """
+    def __init__(self, ready_after: int = 0, child_pid: int = None, fail_inject: bool = False):
+        self.ready_after = ready_after
+        self.child_pid = child_pid
+        self.fail_inject = fail_inject
+        self.spawned = []
+        self.injected = []
+        self.next_pid = 1000
+
+    def spawn(self, args: list, cwd: str, env: dict) -> int:
+        self.next_pid += 1
+        self.spawned.append({"pid": self.next_pid, "args": list(args), "cwd": cwd, "env": dict(env or os.environ)})
+        return self.next_pid
+
+    def find_target(self, pid: int, exe_name: str) -> int | None:
+        if self.ready_after > 0:
+            self.ready_after -= 1
+            return None
+        return self.child_pid or pid
+
+    def inject(self, pid: int, dll_path: str):
+        if self.fail_inject:
+            raise OSError(f"Injection into {pid} failed")
+        self.injected.append((pid, str(dll_path)))
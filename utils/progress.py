@@ -0,0 +1,132 @@
+"""Utils for all related to byte-weighted progress, throughput and ETA"""
+
+import time, threading
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1000 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1000
+
+
+def format_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+def format_stats(stats: dict) -> str:
+    return f"{format_size(stats['rate'])}/s  ·  {format_eta(stats['eta'])} left"
+
+
+class ProgressTracker:
+    """Turn byte counts from one or more weighted stages into progress_callback(fraction, stats).
+
+    stats holds the bytes done/total of the current stage, the smoothed throughput in bytes/sec and
+    the ETA in seconds. Callbacks are throttled to `interval` seconds, except for stage boundaries.
+    The rate only counts bytes moved in this run: work already on disk is reported as `skipped`,
+    and the sample restarts whenever the job is resumed after a pause.
+    """
+    def __init__(self, callback=None, interval: float = 0.1, smoothing: float = 0.3, job=None):
+        self.callback = callback or (lambda *args: None)
+        self.interval = interval
+        self.smoothing = smoothing
+        self.job = job
+        self.lock = threading.Lock()
+
+        self.stage = None
+        self.base = 0.0
+        self.weight = 1.0
+        self.total = 0
+        self.done = 0
+        self.skipped = 0
+        self.rate = 0.0
+        self.sample_time = self.sample_done = 0
+        self.resumes = job.resumes if job else 0
+        self.last_report = 0.0
+
+    def start_stage(self, name: str, total: int, weight: float = 1.0, done: int = 0):
+        with self.lock:
+            self.base += self.weight if self.stage else 0.0
+            self.stage = name
+            self.weight = weight
+            self.total = max(int(total), 0)
+            self.done = self.skipped = done
+            self.rate = 0.0
+            self.restart_sample(time.monotonic())
+        self.report(force=True)
+
+    def restart_sample(self, now: float):
+        self.sample_time, self.sample_done = now, self.done - self.skipped
+
+    def set_total(self, total: int):
+        with self.lock:
+            self.total = max(int(total), 0)
+
+    def shrink(self, size: int):
+        """Drop work that will not happen, such as a failed file, from the stage total."""
+        with self.lock:
+            self.total = max(self.total - int(size), 0)
+
+    def advance(self, size: int):
+        with self.lock:
+            self.done += size
+        self.report()
+
+    def update(self, done: int, total: int | None = None, skipped: int | None = None):
+        """Set absolute progress; skipped is how much of done was already present before this run."""
+        with self.lock:
+            self.done = done
+            if total is not None:
+                self.total = total
+            if skipped is not None:
+                self.skipped = skipped
+        self.report()
+
+    def finish(self):
+        with self.lock:
+            self.done = self.total
+            self.base, self.weight = 1.0, 0.0
+        self.report(force=True)
+
+    def fraction(self) -> float:
+        if not self.total:
+            return min(self.base, 1.0)
+        return min(self.base + self.weight * min(self.done / self.total, 1.0), 1.0)
+
+    def report(self, force: bool = False):
+        now = time.monotonic()
+        with self.lock:
+            if not force and now - self.last_report < self.interval:
+                return
+            self.last_report = now
+
+            work = self.done - self.skipped
+            if self.job and self.job.resumes != self.resumes:
+                # Time spent paused is not throughput
+                self.resumes = self.job.resumes
+                self.rate = 0.0
+                self.restart_sample(now)
+            elif work < self.sample_done:
+                # A transfer restarted from the beginning
+                self.restart_sample(now)
+
+            elapsed = now - self.sample_time
+            if elapsed > 0 and work > self.sample_done:
+                current = (work - self.sample_done) / elapsed
+                self.rate = current if not self.rate else self.smoothing * current + (1 - self.smoothing) * self.rate
+                self.sample_time, self.sample_done = now, work
+
+            remaining = max(self.total - self.done, 0)
+            stats = {
+                "stage": self.stage,
+                "done": self.done,
+                "total": self.total,
+                "rate": self.rate,
+                "eta": remaining / self.rate if self.rate and self.total else None,
+            }
+            fraction = self.fraction()
+
+        self.callback(fraction, stats)
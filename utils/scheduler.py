@@ -0,0 +1,115 @@
+"""Utils for all related to retrying requests and respecting server rate limits"""
+
+import time, random, logging, threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError, HTTPError
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, backoff: float = 0.5, max_backoff: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given zero-based retry attempt."""
+    return random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+
+
+class RateLimitState:
+    """Track X-RateLimit-* and Retry-After per host; observe() works as a requests response hook."""
+    def __init__(self, min_remaining: int = 2):
+        self.min_remaining = min_remaining
+        self.lock = threading.Lock()
+        self.paused_until = {}
+
+    def observe(self, response, *args, **kwargs):
+        host = urlsplit(response.url).hostname
+        headers = response.headers
+        resume_at = None
+
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None and response.status_code in (403, 429, 503):
+            resume_at = time.time() + retry_after
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None and remaining.isdigit() and int(remaining) <= self.min_remaining:
+            resume_at = max(resume_at or 0.0, float(reset))
+            logger.warning(f"Rate limit almost used on {host} ({remaining} left), pausing until reset")
+
+        if resume_at:
+            with self.lock:
+                self.paused_until[host] = max(self.paused_until.get(host, 0.0), resume_at)
+        return response
+
+    def delay(self, host: str) -> float:
+        with self.lock:
+            return max(self.paused_until.get(host, 0.0) - time.time(), 0.0)
+
+
+rate_limits = RateLimitState()
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, HTTPError):
+        response = error.response
+        if response is None:
+            return False
+        if response.status_code in RETRY_STATUS:
+            return True
+        return response.status_code == 403 and (
+            response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers
+        )
+    # Plain OSError is what the streaming writer raises on a size or checksum mismatch
+    return isinstance(error, (ConnectionError, Timeout, ChunkedEncodingError)) or type(error) is OSError
+
+
+class RequestScheduler:
+    """Run request callables with exponential backoff, full jitter and rate-limit pauses."""
+    def __init__(self, retries: int = 4, backoff: float = 0.5, max_backoff: float = 30.0, max_wait: float = 300.0, limits: RateLimitState = rate_limits, sleep=time.sleep):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self.limits = limits
+        self.sleep = sleep
+
+    def wait_for_slot(self, host: str):
+        delay = self.limits.delay(host)
+        if delay > 0:
+            if delay > self.max_wait:
+                raise HTTPError(f"Rate limit for {host} resets in {delay:.0f}s")
+            logger.info(f"Waiting {delay:.1f}s for the {host} rate limit")
+            self.sleep(delay)
+
+    def run(self, url: str, func, *args, cached: bool = False, **kwargs):
+        """Call func(*args, **kwargs) for url, retrying transient failures.
+
+        Pass cached=True when the caller can fall back on a cached answer, such as a conditional
+        request: it is tried once without waiting out rate-limit pauses and any failure is raised.
+        """
+        host = urlsplit(url).hostname
+        retries = 0 if cached else self.retries
+        for attempt in range(retries + 1):
+            if not cached:
+                self.wait_for_slot(host)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == retries or not is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+                logger.warning(f"Request to {url} failed ({e}), retry {attempt + 1}/{retries} in {delay:.1f}s")
+                self.sleep(delay)
@@ -0,0 +1,54 @@
+"""Utils for all related to running startup network checks off the UI thread"""
+
+import time, queue, logging, threading
+from utils.trace import span
+
+logger = logging.getLogger(__name__)
+
+class StartupTasks:
+    """Run startup tasks on daemon threads and hand their results back to the Tk thread.
+
+    Each finished task posts (name, result) on a queue that the Tk side drains with after(), so
+    callbacks always run on the UI thread. Tasks still running at the deadline are abandoned.
+    """
+    def __init__(self, deadline: float = 10.0, interval: int = 100):
+        self.deadline = deadline
+        self.interval = interval
+        self.results = queue.Queue()
+        self.pending = set()
+
+    def submit(self, name: str, func, *args, **kwargs):
+        def run():
+            try:
+                with span(f"startup.{name}", "network"):
+                    result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Startup task {name} failed: {e}")
+                result = None
+            self.results.put((name, result))
+
+        self.pending.add(name)
+        threading.Thread(target=run, name=f"startup-{name}", daemon=True).start()
+
+    def start(self, widget, on_result):
+        """Poll from widget.after() and call on_result(name, result) on the Tk thread."""
+        expires = time.monotonic() + self.deadline
+
+        def poll():
+            while True:
+                try:
+                    name, result = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                self.pending.discard(name)
+                on_result(name, result)
+
+            if not self.pending:
+                return
+            if time.monotonic() >= expires:
+                logger.warning(f"Startup tasks abandoned after {self.deadline}s: {sorted(self.pending)}")
+                self.pending.clear()
+                return
+            widget.after(self.interval, poll)
+
+        widget.after(self.interval, poll)
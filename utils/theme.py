@@ -1,8 +1,9 @@
 """Utils for everything related path to a resource"""
 
-import json, logging
+import os, json, hashlib, logging
 from pathlib import Path
 from utils.path import resource_path
+from utils.files import write_atomic
 # from config import load_config
 
 logger = logging.getLogger(__name__)
@@ -10,66 +11,154 @@ logger = logging.getLogger(__name__)
 class ThemeManager:
     data: dict = {}
     current_theme_path: Path = None
+    # Compiled view of the themes folder: {"fingerprint", "root", "themes": {name: {"json", "data", "files"}}}
+    index: dict = {}
+    index_name = ".index.json"
     default_size = {"Default": (157, 147), "Ghost": (157, 141)}
     custom_size = (256, 256)
 
     def __init__(self, theme_path):
         self.themes_root = Path(theme_path)
 
+    def fingerprint_themes(self) -> str:
+        """Cheap change token from the theme folders, their direct files and subfolder mtimes.
+
+        Adding, removing or renaming an image changes the mtime of the folder holding it, so only
+        directories are stat-ed below the first level, never every image.
+        """
+        fingerprint = hashlib.sha1()
+        with os.scandir(self.themes_root) as themes:
+            for theme in sorted(themes, key=lambda entry: entry.name):
+                if theme.name.startswith(".") or not theme.is_dir():
+                    continue
+                fingerprint.update(f"{theme.name}|{theme.stat().st_mtime_ns}\n".encode())
+                with os.scandir(theme.path) as entries:
+                    for entry in sorted(entries, key=lambda entry: entry.name):
+                        if entry.name.startswith("."):
+                            continue
+                        stat = entry.stat()
+                        fingerprint.update(f"{theme.name}/{entry.name}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+        return fingerprint.hexdigest()
+
+    def scan_themes(self) -> dict:
+        """Walk the themes folder, returning the files of every theme relative to its folder."""
+        files = {}
+        for root, dirs, names in os.walk(self.themes_root):
+            dirs[:] = [folder for folder in dirs if not folder.startswith(".")]
+            relative = Path(root).relative_to(self.themes_root)
+            if not relative.parts:
+                continue
+            for name in names:
+                if not name.startswith("."):
+                    files.setdefault(relative.parts[0], []).append(Path(*relative.parts[1:], name).as_posix())
+        return files
+
+    def compile_index(self, fingerprint: str) -> dict:
+        themes = {}
+        for name, theme_files in self.scan_themes().items():
+            json_files = sorted(file for file in theme_files if "/" not in file and file.endswith(".json"))
+            if not json_files:
+                continue
+
+            try:
+                with open(self.themes_root / name / json_files[0], "r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except Exception as e:
+                logger.error(f"Error loading theme {name}: {e}")
+                data = {}
+
+            themes[name] = {"json": json_files[0], "data": data, "files": sorted(theme_files)}
+
+        return {"fingerprint": fingerprint, "themes": themes}
+
+    def load_index(self) -> dict:
+        """Reuse the compiled index, in memory or from disk, while the fingerprint is unchanged."""
+        if not self.themes_root.exists():
+            ThemeManager.index = {"fingerprint": None, "themes": {}}
+            return ThemeManager.index
+
+        fingerprint = self.fingerprint_themes()
+        if ThemeManager.index.get("fingerprint") == fingerprint:
+            return ThemeManager.index
+
+        index_path = self.themes_root / ThemeManager.index_name
+        try:
+            with open(index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            index = {}
+
+        if index.get("fingerprint") != fingerprint:
+            index = self.compile_index(fingerprint)
+            try:
+                write_atomic(index_path, json.dumps(index))
+            except OSError as e:
+                logger.warning(f"Could not save theme index: {e}")
+            logger.info(f"Theme index compiled for {len(index['themes'])} themes")
+
+        # Windows paths ignore case, so `logo.PNG` must still answer a lookup for `logo.png`
+        for theme in index["themes"].values():
+            theme["files"] = {file.casefold() for file in theme["files"]}
+
+        index["root"] = self.themes_root
+        ThemeManager.index = index
+        return index
+
     def get_available_themes(self):
         if not self.themes_root.exists():
             return ["Default"]
         
-        themes = []
-        for folder in self.themes_root.iterdir():
-            if folder.is_dir():
-                files = list(folder.glob("*.json"))
-                if files:
-                    themes.append(folder.name)
-        
+        themes = list(self.load_index()["themes"])
         return sorted(themes, key=lambda value: (value != "Default", value))
     
     def find_theme(self, theme_folder: Path) -> Path | None:
-        json_files = list(theme_folder.glob("*.json"))
-        return json_files[0] if json_files else None
+        theme = self.load_index()["themes"].get(theme_folder.name)
+        return theme_folder / theme["json"] if theme else None
     
     def load_theme(self, name: str) -> dict:
+        themes = self.load_index()["themes"]
         ThemeManager.current_theme_path = self.themes_root / name
-        theme_json = self.find_theme(ThemeManager.current_theme_path)
+        theme = themes.get(name)
 
-        if not theme_json or not theme_json.exists():
+        if not theme:
             logger.warning(f"Theme not found! Loading default theme")
             ThemeManager.current_theme_path = self.themes_root / "Default"
-            theme_json = self.find_theme(ThemeManager.current_theme_path)
+            theme = themes.get("Default")
 
-            if not theme_json:
+            if not theme:
                 logger.error("Default theme not found!")
                 return ""
         
-        try:
-            with open(theme_json, "r", encoding="utf-8") as file:
-                ThemeManager.data = json.load(file)
-        except Exception as e:
-            logger.error(f"Error loading theme: {e}")
-            ThemeManager.data = {}
+        ThemeManager.data = theme["data"]
 
         # logger.info(f"Theme {name} loaded successfully!")
-        return str(theme_json)
+        return str(ThemeManager.current_theme_path / theme["json"])
     
     @classmethod
     def get_custom_color(cls, color_name: str) -> list | str | None:
         custom_colors = cls.data.get("custom_colors", {})
         return custom_colors.get(color_name)
     
+    @classmethod
+    def has_file(cls, path: Path) -> bool:
+        """Answer from the compiled index, case-insensitively, when path is inside an indexed theme, else stat it."""
+        root = cls.index.get("root")
+        if root and path.is_relative_to(root):
+            parts = path.relative_to(root).parts
+            theme = cls.index["themes"].get(parts[0]) if parts else None
+            if theme:
+                return Path(*parts[1:]).as_posix().casefold() in theme["files"]
+        return path.exists()
+
     @classmethod
     def find_image(cls, base_path: Path):
         Extensions = [".png", ".jpg", ".jpeg"]
-        if base_path.suffix.lower() in Extensions and base_path.exists():
+        if base_path.suffix.lower() in Extensions and cls.has_file(base_path):
             return base_path
         
         for filename in Extensions:
             img_name = base_path.with_suffix(filename)
-            if img_name.exists():
+            if cls.has_file(img_name):
                 return img_name 
         return None
     
@@ -88,7 +177,7 @@ class ThemeManager:
             return fallback
         
         default_path = cls.current_theme_path.parent / "Default" / relative_path
-        if default_path.exists():
+        if cls.has_file(default_path):
             return str(default_path)
         return None
 
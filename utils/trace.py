@@ -0,0 +1,82 @@
+"""Utils for all related to tracing startup and interaction time
+
+Enable with `--trace` or STARLUXE_TRACE=1; spans are written as Chrome trace-event JSON to
+StarLuxe.trace.json on exit (open it in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import os, sys, json, time, atexit, logging, threading
+from contextlib import contextmanager
+from utils.path import resource_path
+
+logger = logging.getLogger(__name__)
+
+enabled = "--trace" in sys.argv or os.environ.get("STARLUXE_TRACE", "") not in ("", "0")
+trace_path = resource_path("StarLuxe.trace.json")
+
+_origin = time.perf_counter_ns()
+_events = []
+_threads = {}
+_lock = threading.Lock()
+
+def _now_us() -> float:
+    return (time.perf_counter_ns() - _origin) / 1000
+
+
+@contextmanager
+def span(name: str, category: str = "app", **args):
+    """Record a complete ("X") event around the block; nested spans show up as a flame stack."""
+    if not enabled:
+        yield
+        return
+
+    start = _now_us()
+    try:
+        yield
+    finally:
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": _now_us() - start,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        with _lock:
+            _events.append(event)
+            _threads.setdefault(thread.ident, thread.name)
+
+
+def mark(name: str, category: str = "app", **args):
+    """Record an instant ("i") event, e.g. the first idle of the main loop."""
+    if not enabled:
+        return
+    event = {"name": name, "cat": category, "ph": "i", "s": "p", "ts": _now_us(), "pid": os.getpid(), "tid": threading.get_ident()}
+    if args:
+        event["args"] = {key: str(value) for key, value in args.items()}
+    with _lock:
+        _events.append(event)
+
+
+def export(path=None):
+    if not enabled:
+        return
+
+    with _lock:
+        events = list(_events)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in _threads.items()
+        ]
+
+    path = path or trace_path
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, file)
+    logger.info(f"Trace with {len(events)} spans written to {path}")
+
+
+if enabled:
+    atexit.register(export)
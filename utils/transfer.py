@@ -0,0 +1,203 @@
+"""Utils for all related to pooled HTTP sessions and concurrent transfers"""
+
+import threading, logging, requests, json, os, time, hashlib
+from pathlib import Path
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError, HTTPError
+from utils.scheduler import rate_limits, is_retryable, backoff_delay
+from utils.jobs import JobPaused
+from utils.files import atomic_open
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+def clamp_concurrency(value) -> int:
+    try:
+        return max(1, min(int(value), MAX_CONCURRENCY))
+    except (TypeError, ValueError):
+        return DEFAULT_CONCURRENCY
+
+
+def get_session(pool_size: int = DEFAULT_CONCURRENCY) -> requests.Session:
+    """Return the process-wide session, growing its connection pool when needed."""
+    global _session
+    pool_size = clamp_concurrency(pool_size)
+
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.pool_size = 0
+            _session.hooks["response"].append(rate_limits.observe)
+
+        if _session.pool_size < pool_size:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+            _session.pool_size = pool_size
+            logger.debug(f"HTTP session pool size: {pool_size}")
+
+        return _session
+
+
+def run_pool(items: list, worker, max_workers: int = DEFAULT_CONCURRENCY, on_done=None) -> list:
+    """Run worker(item) for every item on a bounded pool and return the results in item order.
+
+    The first failing item cancels everything that has not started yet and its exception is re-raised.
+    """
+    max_workers = min(clamp_concurrency(max_workers), max(len(items), 1))
+    results = [None] * len(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="starluxe-download") as pool:
+        futures = {pool.submit(worker, item): index for index, item in enumerate(items)}
+
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+
+            index = futures[future]
+            results[index] = future.result()
+            if on_done:
+                on_done(items[index], results[index])
+
+    return results
+
+
+def stream_to_file(url, output_path, session=None, expected_size=None, expected_sha=None, progress=None, job=None, chunk_size=65536):
+    """Stream url to output_path in fixed-size chunks through a temporary file and an atomic rename.
+
+    expected_sha is a git blob SHA (as listed in the preset manifest) and needs expected_size.
+    The final path is only replaced once the size and hash match, so it never holds a truncated file.
+    """
+    session = session or get_session()
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    digest = None
+    if expected_sha and expected_size is not None:
+        digest = hashlib.sha1(f"blob {expected_size}\0".encode())
+
+    with atomic_open(output_path, "wb", fsync=False) as temp:
+        with session.get(url, stream=True, timeout=(10, 30)) as response:
+            response.raise_for_status()
+            written = 0
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if job:
+                    job.checkpoint()
+                if chunk:
+                    temp.write(chunk)
+                    written += len(chunk)
+                    if digest:
+                        digest.update(chunk)
+                    if progress:
+                        progress(len(chunk))
+
+        if expected_size is not None and written != expected_size:
+            raise IOError(f"Size mismatch for {output_path.name}: expected {expected_size}, got {written} bytes")
+        if digest and digest.hexdigest() != expected_sha:
+            raise IOError(f"Checksum mismatch for {output_path.name}")
+
+    return written
+
+
+def _validator(response) -> dict:
+    return {
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+    }
+
+
+def download_resumable(url, output_path, session=None, headers=None, progress_callback=None, job=None, retries=5, chunk_size=65536, backoff=0.5, sleep=time.sleep):
+    """Download url into output_path, keeping a .part file that later attempts continue with Range.
+
+    The validator (ETag / Last-Modified) of the first response is stored next to the partial file and
+    sent back as If-Range, so the server only resumes when the remote file did not change.
+    Pausing the job drops the connection and continues from the .part file once it is resumed.
+    Dropped connections and 5xx responses are retried with exponential backoff.
+    """
+    session = session or get_session()
+    output_path = Path(output_path)
+    part_path = output_path.with_name(output_path.name + ".part")
+    meta_path = output_path.with_name(output_path.name + ".part.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    attempt = 0
+    # Bytes already in the .part file before this call, reported so they do not count as throughput
+    skipped = None
+    while True:
+        try:
+            meta = {}
+            if part_path.is_file() and meta_path.is_file():
+                with open(meta_path, "r", encoding="utf-8") as file:
+                    meta = json.load(file)
+
+            offset = part_path.stat().st_size if meta.get("url") == url else 0
+            validator = meta.get("etag") or meta.get("last_modified")
+            request_headers = dict(headers or {})
+            if offset and validator:
+                request_headers["Range"] = f"bytes={offset}-"
+                request_headers["If-Range"] = validator
+            else:
+                offset = 0
+
+            with session.get(url, headers=request_headers, stream=True, timeout=(10, 30)) as response:
+                if response.status_code == 416 and offset:
+                    # The partial file already holds every byte
+                    break
+                response.raise_for_status()
+
+                if response.status_code == 206:
+                    logger.info(f"Resuming {output_path.name} at {offset} bytes")
+                    total_size = offset + int(response.headers.get("content-length", 0))
+                    mode = "ab"
+                    if skipped is None:
+                        skipped = offset
+                else:
+                    if offset:
+                        logger.info(f"Remote {output_path.name} changed, restarting download")
+                    offset = skipped = 0
+                    total_size = int(response.headers.get("content-length", 0))
+                    mode = "wb"
+                    with open(meta_path, "w", encoding="utf-8") as file:
+                        json.dump({"url": url, **_validator(response)}, file)
+
+                download = offset
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if job:
+                            job.checkpoint()
+                        if chunk:
+                            f.write(chunk)
+                            download += len(chunk)
+                            if progress_callback and total_size > 0:
+                                progress_callback(download, total_size, skipped)
+
+                if total_size and download < total_size:
+                    raise ChunkedEncodingError(f"Connection closed at {download} of {total_size} bytes")
+            break
+
+        except JobPaused:
+            logger.info(f"Download of {output_path.name} paused")
+            job.wait_if_paused()
+
+        except (ConnectionError, Timeout, ChunkedEncodingError, HTTPError) as e:
+            attempt += 1
+            if attempt >= retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt - 1, backoff)
+            logger.warning(f"Download of {output_path.name} interrupted ({e}), retrying {attempt}/{retries - 1} in {delay:.1f}s")
+            if job:
+                job.sleep(delay)
+            else:
+                sleep(delay)
+
+    os.replace(part_path, output_path)
+    meta_path.unlink(missing_ok=True)
+    return output_path